@@ -1,43 +1,71 @@
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 class LinkedList:
-    def __init__(self):
+    def __init__(self, iterable=None):
         self.head = None
+        self.tail = None
+        self._size = 0
+        if iterable is not None:
+            self.extend(iterable)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
 
     def insert_at_beginning(self, data):
         """Insert a new node at the beginning of the list."""
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._size += 1
         print(f"Inserted {data} at the beginning.")
 
     def insert_at_end(self, data):
         """Insert a new node at the end of the list."""
         new_node = Node(data)
+        self._size += 1
         if self.head is None:
-            self.head = new_node
+            self.head = self.tail = new_node
             print(f"Inserted {data} as the first node.")
             return
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
+        self.tail.next = new_node
+        self.tail = new_node
         print(f"Inserted {data} at the end.")
 
+    def extend(self, iterable):
+        """Append every item of an iterable to the end of the list, without printing."""
+        it = iter(iterable)
+        if self.head is None:
+            for data in it:
+                self.head = self.tail = Node(data)
+                self._size += 1
+                break
+        tail, count = self.tail, 0
+        for data in it:
+            tail.next = tail = Node(data)
+            count += 1
+        self.tail = tail
+        self._size += count
+
     def display(self):
         """Display the linked list."""
         if self.head is None:
             print("Linked list is empty.")
             return
-        current = self.head
         print("Linked list contents:")
-        while current:
-            print(current.data, end=" -> ")
-            current = current.next
-        print("None")
+        print(" -> ".join(map(str, self)) + " -> None")
 
 # Demo: interactively take input from user
 if __name__ == "__main__":
@@ -47,9 +75,10 @@ if __name__ == "__main__":
         print("1. Insert at beginning")
         print("2. Insert at end")
         print("3. Display list")
-        print("4. Exit")
+        print("4. Append many")
+        print("5. Exit")
 
-        choice = input("Enter your choice (1-4): ")
+        choice = input("Enter your choice (1-5): ")
 
         if choice == '1':
             data = input("Enter data to insert at beginning: ")
@@ -60,7 +89,11 @@ if __name__ == "__main__":
         elif choice == '3':
             ll.display()
         elif choice == '4':
+            items = input("Enter data to append (space-separated): ").split()
+            ll.extend(items)
+            print(f"Appended {len(items)} items; list has {len(ll)} nodes.")
+        elif choice == '5':
             print("Exiting program.")
             break
         else:
-            print("Invalid choice. Please enter a number between 1 and 4.")
+            print("Invalid choice. Please enter a number between 1 and 5.")
@@ -31,12 +31,25 @@ class BST:
             result.append(node.key)
             self._inorder_recursive(node.right, result)
 
+    def iter_inorder(self):
+        """Yield keys in sorted order lazily, using an explicit stack instead of recursion."""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
 # Take input from user
-bst = BST()
-user_input = input("Enter numbers to insert into BST (space-separated): ")
-elements = list(map(int, user_input.split()))
-for el in elements:
-    bst.insert(el)
-
-# Display inorder traversal
-print("Inorder Traversal of BST:", bst.inorder_traversal())
+if __name__ == "__main__":
+    bst = BST()
+    user_input = input("Enter numbers to insert into BST (space-separated): ")
+    elements = list(map(int, user_input.split()))
+    for el in elements:
+        bst.insert(el)
+
+    # Display inorder traversal
+    print("Inorder Traversal of BST:", bst.inorder_traversal())
@@ -0,0 +1,294 @@
+class AVLNode:
+    __slots__ = ('key', 'left', 'right', 'height', 'size')
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1  # number of keys in this subtree
+
+
+def _height(node):
+    return node.height if node else 0
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _update(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """Restore the AVL property at node and return the new subtree root."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class AVLTree:
+    """
+    Self-balancing binary search tree with the same ordering rules as BST in
+    Task-4.py (duplicate keys are ignored).
+
+    Insert, delete and search are iterative and O(log n), so sorted input
+    no longer degrades into a linked list or hits the recursion limit.
+    Every node also stores its subtree size, which gives O(log n) rank and
+    select and O(log n + k) range queries.
+    """
+
+    def __init__(self):
+        self.root = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __iter__(self):
+        return self.iter_inorder()
+
+    @classmethod
+    def from_sorted(cls, keys):
+        """
+        Build a perfectly balanced tree from keys in ascending order in O(n).
+        Repeated keys are skipped; raises ValueError if keys are out of order.
+        """
+        unique = []
+        for key in keys:
+            if unique and key <= unique[-1]:
+                if key == unique[-1]:
+                    continue
+                raise ValueError("from_sorted() requires keys in ascending order")
+            unique.append(key)
+
+        def build(lo, hi):
+            # Recursion depth is only log2(n)
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = AVLNode(unique[mid])
+            node.left = build(lo, mid)
+            node.right = build(mid + 1, hi)
+            _update(node)
+            return node
+
+        tree = cls()
+        tree.root = build(0, len(unique))
+        tree._size = len(unique)
+        return tree
+
+    def search(self, key):
+        """Return True if key is in the tree."""
+        node = self.root
+        while node:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def _fix_path(self, path):
+        """Rebalance the nodes on a root-to-leaf path, bottom up."""
+        settled = False
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            if settled:
+                # Heights above are unchanged; only subtree sizes need updating
+                node.size = 1 + _size(node.left) + _size(node.right)
+                continue
+            old_height = node.height
+            new_root = _rebalance(node)
+            if new_root is node and node.height == old_height:
+                settled = True
+                continue
+            if i == 0:
+                self.root = new_root
+            elif path[i - 1].left is node:
+                path[i - 1].left = new_root
+            else:
+                path[i - 1].right = new_root
+
+    def insert(self, key):
+        """Insert key. Return False if it was already present."""
+        if self.root is None:
+            self.root = AVLNode(key)
+            self._size = 1
+            return True
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return False
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = AVLNode(key)
+        else:
+            parent.right = AVLNode(key)
+        self._size += 1
+        self._fix_path(path)
+        return True
+
+    def delete(self, key):
+        """Remove key. Return False if it was not present."""
+        path = []
+        node = self.root
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return False
+
+        if node.left and node.right:
+            # Replace the key with its in-order successor, then unlink the successor
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+
+        child = node.left or node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self._size -= 1
+        self._fix_path(path)
+        return True
+
+    def iter_inorder(self):
+        """Yield keys in sorted order lazily; the first key is available in O(log n)."""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def inorder_traversal(self):
+        return list(self.iter_inorder())
+
+    def rank(self, key, inclusive=False):
+        """Return the number of keys below key (or at most key if inclusive)."""
+        count = 0
+        node = self.root
+        while node:
+            if key < node.key or (key == node.key and not inclusive):
+                node = node.left
+            else:
+                count += _size(node.left) + 1
+                node = node.right
+        return count
+
+    def select(self, k):
+        """Return the k-th smallest key (0-based, negative k counts from the end)."""
+        if k < 0:
+            k += self._size
+        if not 0 <= k < self._size:
+            raise IndexError("select() index out of range")
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.key
+            else:
+                k -= left + 1
+                node = node.right
+
+    def percentile(self, p):
+        """Return the key at percentile p (0-100) using the nearest-rank method."""
+        if not self._size:
+            raise IndexError("percentile() of an empty tree")
+        if not 0 <= p <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        return self.select(max(0, int(-(-p * self._size // 100)) - 1))
+
+    def count_range(self, lo, hi):
+        """Return the number of keys with lo <= key <= hi in O(log n)."""
+        if hi < lo:
+            return 0
+        return self.rank(hi, inclusive=True) - self.rank(lo)
+
+    def iter_range(self, lo, hi):
+        """Yield the keys with lo <= key <= hi in order, in O(log n + k)."""
+        stack = []
+        node = self.root
+        # Stack the ancestors whose keys are >= lo, exactly as an in-order walk would
+        while node:
+            if node.key < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if node.key > hi:
+                return
+            yield node.key
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+
+    def height(self):
+        return _height(self.root)
+
+
+# Take input from user
+if __name__ == "__main__":
+    tree = AVLTree()
+    user_input = input("Enter numbers to insert into AVL tree (space-separated): ")
+    for el in map(int, user_input.split()):
+        tree.insert(el)
+
+    print("Inorder Traversal of AVL tree:", tree.inorder_traversal())
+    print(f"Height: {tree.height()} for {len(tree)} keys")
+    if len(tree):
+        print(f"Median: {tree.percentile(50)}, 90th percentile: {tree.percentile(90)}")
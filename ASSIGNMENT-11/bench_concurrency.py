@@ -0,0 +1,97 @@
+"""
+Contention and throughput benchmark for the concurrent Stack and Queue.
+
+For each producer/consumer count, producers push a fixed total number of
+items and consumers pop exactly their share, so every run ends as soon as
+the last item is taken. The stdlib queue.Queue is timed as a baseline.
+
+Usage:
+    python bench_concurrency.py --items 200000 --counts 1 2 4 8 16 32 64
+"""
+import argparse
+import asyncio
+import queue
+import threading
+import time
+
+from concurrent_buffers import AsyncQueue, AsyncStack, ThreadSafeQueue, ThreadSafeStack
+
+THREAD_BUFFERS = {
+    'ThreadSafeQueue': ThreadSafeQueue,
+    'ThreadSafeStack': ThreadSafeStack,
+    'queue.Queue': queue.Queue,
+}
+ASYNC_BUFFERS = {
+    'AsyncQueue': AsyncQueue,
+    'AsyncStack': AsyncStack,
+}
+
+
+def _shares(total, parts):
+    return [total // parts + (1 if k < total % parts else 0) for k in range(parts)]
+
+
+def bench_threads(factory, producers, consumers, items, maxsize=0):
+    buffer = factory(maxsize)
+    start_gate = threading.Barrier(producers + consumers + 1)
+
+    def produce(n):
+        start_gate.wait()
+        for i in range(n):
+            buffer.put(i)
+
+    def consume(n):
+        start_gate.wait()
+        for _ in range(n):
+            buffer.get()
+
+    threads = [threading.Thread(target=produce, args=(n,)) for n in _shares(items, producers)]
+    threads += [threading.Thread(target=consume, args=(n,)) for n in _shares(items, consumers)]
+    for thread in threads:
+        thread.start()
+    start_gate.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+async def _bench_async(factory, producers, consumers, items, maxsize):
+    buffer = factory(maxsize)
+
+    async def produce(n):
+        for i in range(n):
+            await buffer.put(i)
+
+    async def consume(n):
+        for _ in range(n):
+            await buffer.get()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(produce(n) for n in _shares(items, producers)),
+                         *(consume(n) for n in _shares(items, consumers)))
+    return time.perf_counter() - start
+
+
+def bench_async(factory, producers, consumers, items, maxsize=0):
+    return asyncio.run(_bench_async(factory, producers, consumers, items, maxsize))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent Stack/Queue benchmark")
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--counts", type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64],
+                        help="producer and consumer counts to try (each run uses N of each)")
+    parser.add_argument("--maxsize", type=int, default=0,
+                        help="bound the buffers to this many items (default: unbounded)")
+    args = parser.parse_args()
+
+    names = list(THREAD_BUFFERS) + list(ASYNC_BUFFERS)
+    print(f"{'workers':>8}" + "".join(f"{name:>18}" for name in names) + "   (items/sec)")
+    for n in args.counts:
+        row = []
+        for name, factory in THREAD_BUFFERS.items():
+            row.append(args.items / bench_threads(factory, n, n, args.items, args.maxsize))
+        for name, factory in ASYNC_BUFFERS.items():
+            row.append(args.items / bench_async(factory, n, n, args.items, args.maxsize))
+        print(f"{n:>8}" + "".join(f"{rate:>18,.0f}" for rate in row))
@@ -0,0 +1,63 @@
+"""
+Benchmark: list-based Queue (Task-2.py) against RingQueue.
+
+Each run fills the queue with n items and then drains it. The list-based
+queue prints on every operation, so its output is sent to os.devnull to
+time the data structure rather than the terminal.
+
+Usage:
+    python bench_queue.py --sizes 1000 10000 100000 1000000
+"""
+import argparse
+import contextlib
+import importlib
+import os
+import time
+
+from ring_queue import RingQueue
+
+Queue = importlib.import_module("Task-2").Queue
+
+
+def bench_list_queue(n):
+    queue = Queue()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for i in range(n):
+            queue.enqueue(i)
+        while not queue.is_empty():
+            queue.dequeue()
+        return time.perf_counter() - start
+
+
+def bench_ring_queue(n):
+    queue = RingQueue(quiet=True)
+    start = time.perf_counter()
+    for i in range(n):
+        queue.enqueue(i)
+    while not queue.is_empty():
+        queue.dequeue()
+    return time.perf_counter() - start
+
+
+def bench_ring_queue_bulk(n, batch=1024):
+    queue = RingQueue(quiet=True)
+    start = time.perf_counter()
+    for lo in range(0, n, batch):
+        queue.enqueue_many(range(lo, min(n, lo + batch)))
+    while not queue.is_empty():
+        queue.dequeue_many(batch)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Queue benchmark")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--list-max", type=int, default=200_000,
+                        help="skip the list-based Queue above this size (it is O(n^2))")
+    args = parser.parse_args()
+
+    print(f"{'n':>10}{'list Queue':>14}{'RingQueue':>14}{'RingQueue bulk':>16}")
+    for n in args.sizes:
+        list_time = f"{bench_list_queue(n):.4f}s" if n <= args.list_max else "skipped"
+        print(f"{n:>10}{list_time:>14}{bench_ring_queue(n):>13.4f}s{bench_ring_queue_bulk(n):>15.4f}s")
@@ -0,0 +1,168 @@
+"""
+Compact on-disk snapshots of a binary search tree, searchable through mmap.
+
+File layout (little-endian):
+
+    header  magic b"BSTS", format version (u32), node count (u64), root index (i64)
+    nodes   one 16-byte record per node: key (i64), left index (i32), right index (i32)
+
+Child index -1 means no child. Nodes are stored in breadth-first order, so
+the top levels of the tree, which every lookup touches, share a few pages.
+`MappedBST` reads records straight from the mapped file; nothing is
+deserialized up front, so opening a snapshot of any size is instant.
+"""
+import mmap
+import struct
+from collections import deque
+
+MAGIC = b"BSTS"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIQq")
+NODE = struct.Struct("<qii")
+MAX_NODES = 2 ** 31 - 1
+WRITE_BATCH = 65_536
+
+
+def _root_of(tree):
+    """Accept a BST / AVLTree (anything with .root) or a bare node."""
+    return getattr(tree, 'root', tree)
+
+
+def write_snapshot(tree, path):
+    """
+    Write a Node-based tree (BST from Task-4.py, AVLTree, or a root node) to path.
+    Keys must be integers that fit in 64 bits. Returns the number of nodes written.
+    """
+    root = _root_of(tree)
+    # First pass: breadth-first order gives every node its index
+    order = []
+    if root is not None:
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+    if len(order) > MAX_NODES:
+        raise ValueError(f"snapshots hold at most {MAX_NODES} nodes")
+    index = {id(node): i for i, node in enumerate(order)}
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(order), 0 if order else -1))
+        buffer = bytearray(NODE.size * WRITE_BATCH)
+        for start in range(0, len(order), WRITE_BATCH):
+            batch = order[start:start + WRITE_BATCH]
+            for i, node in enumerate(batch):
+                try:
+                    NODE.pack_into(buffer, i * NODE.size, node.key,
+                                   index[id(node.left)] if node.left else -1,
+                                   index[id(node.right)] if node.right else -1)
+                except struct.error:
+                    raise ValueError(f"key {node.key!r} is not a 64-bit integer")
+            file.write(memoryview(buffer)[:len(batch) * NODE.size])
+    return len(order)
+
+
+class MappedBST:
+    """Read-only BST backed by a memory-mapped snapshot file."""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path}: not a BST snapshot")
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: not a BST snapshot")
+        magic, version, count, root = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a version {FORMAT_VERSION} BST snapshot")
+        if len(self._map) < HEADER.size + count * NODE.size:
+            self.close()
+            raise ValueError(f"{path}: snapshot is truncated")
+        self._count = count
+        self._root = root
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __iter__(self):
+        return self.iter_inorder()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if getattr(self, '_map', None) is not None and not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def _node(self, i):
+        return NODE.unpack_from(self._map, HEADER.size + i * NODE.size)
+
+    def search(self, key):
+        """Return True if key is in the snapshot, reading only the nodes on its path."""
+        unpack, buf, base, size = NODE.unpack_from, self._map, HEADER.size, NODE.size
+        i = self._root
+        while i >= 0:
+            node_key, left, right = unpack(buf, base + i * size)
+            if key < node_key:
+                i = left
+            elif key > node_key:
+                i = right
+            else:
+                return True
+        return False
+
+    def iter_inorder(self):
+        """Yield keys in sorted order lazily."""
+        stack = []
+        i = self._root
+        while stack or i >= 0:
+            while i >= 0:
+                record = self._node(i)
+                stack.append(record)
+                i = record[1]
+            key, _, right = stack.pop()
+            yield key
+            i = right
+
+    def to_avl(self):
+        """Load the snapshot into an in-memory AVLTree in O(n)."""
+        from avl_tree import AVLTree
+        return AVLTree.from_sorted(self.iter_inorder())
+
+
+# Demo: reuse a snapshot if one exists, otherwise build the tree from input and save it
+if __name__ == "__main__":
+    import importlib
+    import os
+
+    snapshot_path = "bst.snapshot"
+    if not os.path.exists(snapshot_path):
+        BST = importlib.import_module("Task-4").BST
+        bst = BST()
+        user_input = input("Enter numbers to insert into BST (space-separated): ")
+        for el in map(int, user_input.split()):
+            bst.insert(el)
+        print(f"Saved {write_snapshot(bst, snapshot_path)} nodes to {snapshot_path}")
+
+    with MappedBST(snapshot_path) as tree:
+        print(f"Loaded {len(tree)} keys from {snapshot_path}")
+        try:
+            key = int(input("Enter a number to search for: "))
+        except ValueError:
+            print("Please enter a valid integer.")
+        else:
+            print(f"{key} is in the tree." if key in tree else f"{key} is not in the tree.")
@@ -0,0 +1,208 @@
+"""
+Thread-safe and asyncio versions of the Stack (Task-1.py) and Queue (Task-2.py).
+
+ThreadSafeStack / ThreadSafeQueue
+    For producer and consumer threads. put/get block with an optional
+    timeout and raise queue.Full / queue.Empty when it expires. On an
+    unbounded buffer, put and a get that finds an item do not take a lock:
+    they rely on deque.append/pop/popleft being atomic. The lock is only
+    taken to sleep, to wake sleepers, and for puts on a bounded buffer.
+
+AsyncStack / AsyncQueue
+    For coroutines on one event loop, with awaitable put/get.
+
+None of these print per operation.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from queue import Empty, Full
+
+
+class _ThreadSafeBuffer:
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        # Sleeping getters/putters. Each registers under the lock before its
+        # final check, so a lock-free operation that reads zero here cannot
+        # miss a sleeper.
+        self._getters = 0
+        self._putters = 0
+
+    def _pop(self):
+        raise NotImplementedError
+
+    def __len__(self):
+        return len(self._items)
+
+    def is_empty(self):
+        """Check if the buffer is empty."""
+        return not self._items
+
+    def put(self, item, block=True, timeout=None):
+        """Add an item. On a full bounded buffer, wait up to timeout, then raise queue.Full."""
+        if self.maxsize <= 0:
+            self._items.append(item)
+        else:
+            with self._not_full:
+                self._putters += 1
+                try:
+                    if not self._wait(self._not_full, lambda: len(self._items) < self.maxsize,
+                                      block, timeout):
+                        raise Full
+                    self._items.append(item)
+                finally:
+                    self._putters -= 1
+        if self._getters:
+            with self._lock:
+                self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """Remove and return an item. When empty, wait up to timeout, then raise queue.Empty."""
+        try:
+            item = self._pop()
+        except IndexError:
+            if not block:
+                raise Empty
+            item = self._get_slow(timeout)
+        if self._putters:
+            with self._lock:
+                self._not_full.notify()
+        return item
+
+    def _get_slow(self, timeout):
+        result = []
+
+        def take():
+            try:
+                result.append(self._pop())
+                return True
+            except IndexError:
+                return False
+
+        with self._not_empty:
+            self._getters += 1
+            try:
+                if not self._wait(self._not_empty, take, True, timeout):
+                    raise Empty
+            finally:
+                self._getters -= 1
+        return result[0]
+
+    @staticmethod
+    def _wait(condition, predicate, block, timeout):
+        if predicate():
+            return True
+        if not block:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            condition.wait(remaining)
+            if predicate():
+                return True
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+
+class ThreadSafeStack(_ThreadSafeBuffer):
+    """LIFO buffer shared between threads."""
+
+    def _pop(self):
+        return self._items.pop()
+
+    def push(self, item):
+        """Add an item to the top of the stack, waiting if the stack is bounded and full."""
+        self.put(item)
+
+    def pop(self):
+        """Remove and return the top item of the stack. Return None if stack is empty."""
+        try:
+            return self.get(block=False)
+        except Empty:
+            return None
+
+    def peek(self):
+        """Return the top item of the stack without removing it. Return None if stack is empty."""
+        try:
+            return self._items[-1]
+        except IndexError:
+            return None
+
+
+class ThreadSafeQueue(_ThreadSafeBuffer):
+    """FIFO buffer shared between threads."""
+
+    def _pop(self):
+        return self._items.popleft()
+
+    def enqueue(self, item):
+        """Add an item to the end of the queue, waiting if the queue is bounded and full."""
+        self.put(item)
+
+    def dequeue(self):
+        """Remove and return the item from the front of the queue. Return None if queue is empty."""
+        try:
+            return self.get(block=False)
+        except Empty:
+            return None
+
+
+class _AsyncBufferMixin:
+    async def put(self, item, timeout=None):
+        """Add an item; on a full bounded buffer wait up to timeout, then raise queue.Full."""
+        try:
+            await asyncio.wait_for(super().put(item), timeout)
+        except asyncio.TimeoutError:
+            raise Full
+
+    async def get(self, timeout=None):
+        """Remove and return an item; when empty wait up to timeout, then raise queue.Empty."""
+        try:
+            return await asyncio.wait_for(super().get(), timeout)
+        except asyncio.TimeoutError:
+            raise Empty
+
+    def is_empty(self):
+        return self.empty()
+
+    def __len__(self):
+        return self.qsize()
+
+
+class AsyncStack(_AsyncBufferMixin, asyncio.LifoQueue):
+    """LIFO buffer shared between coroutines."""
+
+    async def push(self, item):
+        await self.put(item)
+
+    def pop(self):
+        """Remove and return the top item of the stack. Return None if stack is empty."""
+        try:
+            return self.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+
+class AsyncQueue(_AsyncBufferMixin, asyncio.Queue):
+    """FIFO buffer shared between coroutines."""
+
+    async def enqueue(self, item):
+        await self.put(item)
+
+    def dequeue(self):
+        """Remove and return the item from the front of the queue. Return None if queue is empty."""
+        try:
+            return self.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
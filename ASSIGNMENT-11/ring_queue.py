@@ -0,0 +1,166 @@
+class RingQueue:
+    """
+    FIFO queue backed by a circular buffer.
+
+    enqueue and dequeue are O(1) amortized. With capacity=None the buffer
+    doubles when full and halves when it drops to a quarter; with a fixed
+    capacity the buffer never grows and enqueue refuses items when full, so
+    producers see backpressure. With quiet=True nothing is printed per
+    operation.
+    """
+
+    MIN_CAPACITY = 8
+
+    def __init__(self, capacity=None, quiet=False):
+        if capacity is not None and capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.quiet = quiet
+        self._buffer = [None] * (capacity or self.MIN_CAPACITY)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return self._size == 0
+
+    def is_full(self):
+        """Check if a fixed-capacity queue has no free slots."""
+        return self.capacity is not None and self._size == self.capacity
+
+    def _resize(self, new_size):
+        """Copy the items, in order, into a new buffer of new_size slots."""
+        self._buffer = self._items() + [None] * (new_size - self._size)
+        self._head = 0
+
+    def _items(self):
+        end = self._head + self._size
+        if end <= len(self._buffer):
+            return self._buffer[self._head:end]
+        return self._buffer[self._head:] + self._buffer[:end - len(self._buffer)]
+
+    def enqueue(self, item):
+        """Add an item to the end of the queue. Return False if the queue is full."""
+        if self._size == len(self._buffer):
+            if self.capacity is not None:
+                if not self.quiet:
+                    print(f"Queue is full. Cannot enqueue {item}.")
+                return False
+            self._resize(2 * len(self._buffer))
+        self._buffer[(self._head + self._size) % len(self._buffer)] = item
+        self._size += 1
+        if not self.quiet:
+            print(f"Enqueued {item} to queue.")
+        return True
+
+    def dequeue(self):
+        """Remove and return the item from the front of the queue. Return None if queue is empty."""
+        if self._size == 0:
+            if not self.quiet:
+                print("Queue is empty. Cannot dequeue.")
+            return None
+        item = self._buffer[self._head]
+        self._buffer[self._head] = None  # drop the reference
+        self._head = (self._head + 1) % len(self._buffer)
+        self._size -= 1
+        self._maybe_shrink()
+        if not self.quiet:
+            print(f"Dequeued {item} from queue.")
+        return item
+
+    def peek(self):
+        """Return the front item without removing it. Return None if queue is empty."""
+        return self._buffer[self._head] if self._size else None
+
+    def enqueue_many(self, items):
+        """
+        Add items in order and return how many were accepted. A fixed-capacity
+        queue stops at the first item that does not fit.
+        """
+        items = list(items)
+        free = len(self._buffer) - self._size
+        if len(items) > free:
+            if self.capacity is None:
+                new_size = len(self._buffer)
+                while new_size - self._size < len(items):
+                    new_size *= 2
+                self._resize(new_size)
+            else:
+                items = items[:free]
+        n = len(items)
+        if n:
+            size = len(self._buffer)
+            tail = (self._head + self._size) % size
+            first = min(n, size - tail)
+            self._buffer[tail:tail + first] = items[:first]
+            self._buffer[:n - first] = items[first:]
+            self._size += n
+        if not self.quiet:
+            print(f"Enqueued {n} items to queue.")
+        return n
+
+    def dequeue_many(self, n):
+        """Remove and return up to n items from the front of the queue, in order."""
+        n = max(0, min(n, self._size))
+        size = len(self._buffer)
+        first = min(n, size - self._head)
+        items = self._buffer[self._head:self._head + first]
+        self._buffer[self._head:self._head + first] = [None] * first
+        if first < n:
+            items += self._buffer[:n - first]
+            self._buffer[:n - first] = [None] * (n - first)
+        self._head = (self._head + n) % size
+        self._size -= n
+        self._maybe_shrink()
+        if not self.quiet:
+            print(f"Dequeued {n} items from queue.")
+        return items
+
+    def _maybe_shrink(self):
+        if self.capacity is not None:
+            return
+        size = len(self._buffer)
+        while size > self.MIN_CAPACITY and self._size <= size // 4:
+            size //= 2
+        if size != len(self._buffer):
+            self._resize(size)
+
+
+# Demo: interactively take input from user
+if __name__ == "__main__":
+    capacity = input("Enter a fixed capacity (press Enter for a growable queue): ").strip()
+    queue = RingQueue(int(capacity) if capacity else None)
+    while True:
+        print("\nChoose an operation:")
+        print("1. Enqueue")
+        print("2. Dequeue")
+        print("3. Enqueue many")
+        print("4. Dequeue many")
+        print("5. Check if empty")
+        print("6. Exit")
+
+        choice = input("Enter your choice (1-6): ")
+
+        if choice == '1':
+            item = input("Enter item to enqueue: ")
+            queue.enqueue(item)
+        elif choice == '2':
+            queue.dequeue()
+        elif choice == '3':
+            items = input("Enter items to enqueue (space-separated): ").split()
+            queue.enqueue_many(items)
+        elif choice == '4':
+            try:
+                print(queue.dequeue_many(int(input("How many items to dequeue: "))))
+            except ValueError:
+                print("Please enter a valid integer.")
+        elif choice == '5':
+            print("Queue is empty." if queue.is_empty() else "Queue is not empty.")
+        elif choice == '6':
+            print("Exiting program.")
+            break
+        else:
+            print("Invalid choice. Please enter a number between 1 and 6.")
@@ -0,0 +1,110 @@
+class UnrolledNode:
+    __slots__ = ('items', 'next')
+
+    def __init__(self, items=None):
+        self.items = items if items is not None else []
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    Linked list whose nodes each hold a Python list of up to node_capacity items.
+
+    Compared with one node per item (LinkedList in Task-3.py) this needs far
+    fewer node objects and pointer hops, so building and traversing lists of
+    millions of items is much faster and uses less memory. Appends are O(1);
+    inserting at the front or indexing walks whole nodes, not single items.
+    """
+
+    def __init__(self, iterable=None, node_capacity=64):
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self.node_capacity = node_capacity
+        self.head = None
+        self.tail = None
+        self._size = 0
+        if iterable is not None:
+            self.extend(iterable)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        node = self.head
+        while node:
+            yield from node.items
+            node = node.next
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("UnrolledLinkedList index out of range")
+        node = self.head
+        while index >= len(node.items):
+            index -= len(node.items)
+            node = node.next
+        return node.items[index]
+
+    def append(self, data):
+        """Insert an item at the end of the list."""
+        if self.tail is None:
+            self.head = self.tail = UnrolledNode()
+        elif len(self.tail.items) == self.node_capacity:
+            self.tail.next = UnrolledNode()
+            self.tail = self.tail.next
+        self.tail.items.append(data)
+        self._size += 1
+
+    def insert_at_beginning(self, data):
+        """Insert an item at the beginning of the list."""
+        if self.head is None or len(self.head.items) == self.node_capacity:
+            node = UnrolledNode()
+            node.next = self.head
+            self.head = node
+            if self.tail is None:
+                self.tail = node
+        self.head.items.insert(0, data)
+        self._size += 1
+
+    def extend(self, iterable):
+        """Append every item of an iterable, filling whole nodes at a time."""
+        items = list(iterable)
+        start = 0
+        if self.tail is not None:
+            room = self.node_capacity - len(self.tail.items)
+            self.tail.items.extend(items[:room])
+            start = room
+        for lo in range(start, len(items), self.node_capacity):
+            node = UnrolledNode(items[lo:lo + self.node_capacity])
+            if self.tail is None:
+                self.head = self.tail = node
+            else:
+                self.tail.next = node
+                self.tail = node
+        self._size += len(items)
+
+    def display(self):
+        """Display the list."""
+        if self.head is None:
+            print("Linked list is empty.")
+            return
+        print("Linked list contents:")
+        print(" -> ".join(map(str, self)) + " -> None")
+
+
+# Demo: compare build and traversal time with the node-per-item LinkedList
+if __name__ == "__main__":
+    import importlib
+    import time
+
+    LinkedList = importlib.import_module("Task-3").LinkedList
+    n = 2_000_000
+    for name, factory in (("LinkedList", LinkedList), ("UnrolledLinkedList", UnrolledLinkedList)):
+        start = time.perf_counter()
+        lst = factory(range(n))
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        total = sum(lst)
+        walked = time.perf_counter() - start
+        print(f"{name:<20} build {built:.3f}s  traverse {walked:.3f}s  ({len(lst)} items, sum {total})")
@@ -0,0 +1,212 @@
+"""
+Integer factorization built on prime_engine.py.
+
+1. Trial division by the sieved primes below TRIAL_BOUND strips small
+   factors.
+2. Each remaining cofactor is either certified prime by Miller-Rabin
+   (is_probable_prime) or split by Pollard's rho, Brent's variant, and the
+   parts are handled the same way until every part is prime.
+
+Results are sorted tuples of prime factors with multiplicity, e.g.
+factorize(360) == (2, 2, 2, 3, 3, 5). Recent results are kept in a bounded
+LRU cache, and factorize_many() factors a batch in a process pool.
+
+Usage:
+    python factorize.py 600851475143 1000000016000000063
+    python factorize.py --file numbers.txt --workers 8
+"""
+import argparse
+import math
+import os
+import random
+import sys
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from prime_engine import base_primes, is_probable_prime
+
+TRIAL_BOUND = 10_000
+CACHE_SIZE = 100_000
+BATCH_MIN_SIZE = 64  # smaller batches are factored in this process
+
+_TRIAL_PRIMES = base_primes(TRIAL_BOUND).tolist()
+
+
+class FactorCache:
+    """Bounded LRU map from n to its factorization."""
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, n):
+        factors = self._data.get(n)
+        if factors is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(n)
+        self.hits += 1
+        return factors
+
+    def put(self, n, factors):
+        self._data[n] = factors
+        self._data.move_to_end(n)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = 0
+
+
+cache = FactorCache()
+
+
+def pollard_brent(n: int) -> int:
+    """Return a nontrivial factor of the odd composite n (Brent's variant of Pollard's rho)."""
+    if n % 2 == 0:
+        return 2
+    batch = 128  # multiply this many differences together per gcd
+    while True:
+        y, c = random.randrange(1, n), random.randrange(1, n)
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            r *= 2
+        if g == n:
+            # The batch overshot; redo it one step at a time from the saved point
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = math.gcd(abs(x - saved), n)
+        if g != n:
+            return g
+        # This c cycled without splitting n; try another
+
+
+def _factor_large(n: int, factors: list):
+    """Append the prime factors of n, which has no prime factor below TRIAL_BOUND."""
+    stack = [n]
+    while stack:
+        m = stack.pop()
+        if m == 1:
+            continue
+        if is_probable_prime(m):
+            factors.append(m)
+            continue
+        root = math.isqrt(m)
+        if root * root == m:
+            stack += [root, root]
+            continue
+        d = pollard_brent(m)
+        stack += [d, m // d]
+
+
+def _factorize(n: int) -> tuple:
+    factors = []
+    for p in _TRIAL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    if n > 1:
+        if n < TRIAL_BOUND * TRIAL_BOUND:
+            factors.append(n)  # no factor up to its square root, so prime
+        else:
+            _factor_large(n, factors)
+    return tuple(sorted(factors))
+
+
+def _check(n):
+    if not isinstance(n, int):
+        raise TypeError("factorize() requires an integer")
+    if n < 1:
+        raise ValueError("factorize() requires a positive integer")
+
+
+def factorize(n: int) -> tuple:
+    """Return the prime factors of n in ascending order, with multiplicity (1 -> ())."""
+    _check(n)
+    factors = cache.get(n)
+    if factors is None:
+        factors = _factorize(n)
+        cache.put(n, factors)
+    return factors
+
+
+def factorize_many(numbers, workers=None) -> list:
+    """
+    Factor many numbers, in a process pool when the batch is large. Cached
+    and repeated numbers are factored only once; results are in input order.
+    """
+    numbers = list(numbers)
+    for n in numbers:
+        _check(n)
+    results = {}
+    todo = []
+    for n in dict.fromkeys(numbers):
+        factors = cache.get(n)
+        if factors is None:
+            todo.append(n)
+        else:
+            results[n] = factors
+    if len(todo) < BATCH_MIN_SIZE or workers == 1:
+        found = map(_factorize, todo)
+    else:
+        workers = workers or os.cpu_count()
+        with ProcessPoolExecutor(workers) as pool:
+            found = list(pool.map(_factorize, todo,
+                                  chunksize=max(1, len(todo) // (workers * 16))))
+    for n, factors in zip(todo, found):
+        cache.put(n, factors)
+        results[n] = factors
+    return [results[n] for n in numbers]
+
+
+def format_factors(factors) -> str:
+    """Format (2, 2, 3) as '2^2 * 3'."""
+    if not factors:
+        return "1"
+    return " * ".join(f"{p}^{k}" if k > 1 else str(p)
+                      for p, k in sorted(Counter(factors).items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Factor integers")
+    parser.add_argument("numbers", type=int, nargs='*')
+    parser.add_argument("--file", help="read whitespace-separated integers from this file")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes for large batches (default: all CPUs)")
+    args = parser.parse_args()
+
+    numbers = list(args.numbers)
+    try:
+        if args.file:
+            with open(args.file) as file:
+                numbers += [int(token) for token in file.read().split()]
+        results = factorize_many(numbers, args.workers)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    for n, factors in zip(numbers, results):
+        print(f"{n} = {format_factors(factors)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Prime engine: a bit-packed segmented sieve with the same answers as
+is_prime in Task 2.py.
+
+- primes_between(lo, hi) streams the primes in [lo, hi) segment by segment,
+  so memory stays at one segment however large the range.
+- PrimeSieve(limit) keeps one bit per odd number up to limit (10^9 needs
+  about 60 MB) and answers lookups in O(1).
+- is_prime(n) picks its method by size: the sieve if one already covers n,
+  deterministic Miller-Rabin below 2^64 (exact, like trial division) and
+  probabilistic Miller-Rabin with random bases above that.
+- is_prime_many(values) answers a whole array at once: from a sieve when
+  one covers the values or the batch is dense enough to pay for building
+  it, with is_prime otherwise.
+- count_primes(lo, hi) splits a range across worker processes.
+
+Usage:
+    python prime_engine.py between 1000000000 1000001000
+    python prime_engine.py test 97 100 2147483647 1000000000000000003
+    python prime_engine.py count 0 10000000000 --workers 32
+"""
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+SEGMENT_SIZE = 1 << 22  # odd numbers per segment (4 MB of booleans)
+SIEVE_LIMIT = 1 << 30  # largest sieve is_prime_many() builds by itself
+# is_prime_many() builds or grows a sieve only for batches of at least
+# SIEVE_MIN_BATCH values with at most SIEVE_PAYOFF numbers to sieve per value;
+# sieving costs ~3 ns a number and Miller-Rabin ~2 us a value
+SIEVE_MIN_BATCH = 64
+SIEVE_PAYOFF = 1_000
+# These bases make Miller-Rabin exact for every n < 2^64 (Jim Sinclair's set)
+DETERMINISTIC_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+PROBABLE_PRIME_ROUNDS = 40  # random bases above 2^64; error below 4^-40
+SMALL_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+SMALL_PRIMES_PRODUCT = math.prod(SMALL_PRIMES)
+
+
+def _require_int(n):
+    if not isinstance(n, (int, np.integer)):
+        raise TypeError("is_prime() requires an integer")
+
+
+def base_primes(limit: int) -> np.ndarray:
+    """All primes <= limit with a plain (unsegmented) sieve; for limit up to ~10^8."""
+    if limit < 2:
+        return np.empty(0, dtype=np.int64)
+    # odd[i] stands for 2i + 1
+    odd = np.ones(limit // 2 + 1, dtype=bool)
+    odd[0] = False
+    for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if odd[i]:
+            p = 2 * i + 1
+            odd[p * p // 2::p] = False
+    primes = 2 * np.flatnonzero(odd[:(limit - 1) // 2 + 1]) + 1
+    return np.concatenate(([2], primes)).astype(np.int64)
+
+
+def _odd_segment(lo: int, count: int, primes: np.ndarray) -> np.ndarray:
+    """
+    Primality of the odd numbers lo, lo + 2, ..., lo + 2(count - 1) (lo odd),
+    given every odd prime up to the square root of the last one.
+    """
+    segment = np.ones(count, dtype=bool)
+    hi = lo + 2 * count
+    for p in primes[1:].tolist():  # skip 2; the segment holds odd numbers only
+        if p * p >= hi:
+            break
+        # First odd multiple of p that is >= max(p*p, lo)
+        start = max(p * p, (lo + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        segment[(start - lo) // 2::p] = False
+    if lo == 1:
+        segment[0] = False  # 1 is not prime
+    return segment
+
+
+def iter_prime_segments(lo: int, hi: int, segment_size: int = SEGMENT_SIZE):
+    """Yield the primes in [lo, hi) as sorted int64 arrays, one segment at a time."""
+    lo = max(lo, 0)
+    if hi <= lo:
+        return
+    primes = base_primes(math.isqrt(hi - 1))
+    if lo <= 2 < hi:
+        yield np.array([2], dtype=np.int64)
+    start = max(lo, 3) | 1  # first odd number >= max(lo, 3)
+    while start < hi:
+        count = min(segment_size, (hi - start + 1) // 2)
+        segment = _odd_segment(start, count, primes)
+        yield start + 2 * np.flatnonzero(segment).astype(np.int64)
+        start += 2 * count
+
+
+def primes_between(lo: int, hi: int):
+    """Yield the primes p with lo <= p < hi in increasing order, like range(lo, hi)."""
+    for primes in iter_prime_segments(lo, hi):
+        yield from primes.tolist()
+
+
+class PrimeSieve:
+    """Bit-packed sieve of Eratosthenes over the odd numbers up to limit."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        odds = limit // 2 + 1  # odd numbers 1, 3, ..., up to limit (bit i is 2i + 1)
+        self._bits = np.zeros((odds + 7) // 8, dtype=np.uint8)
+        primes = base_primes(math.isqrt(limit))
+        # Whole bytes per segment, so each segment packs straight into place
+        step = SEGMENT_SIZE - SEGMENT_SIZE % 8
+        for first in range(0, odds, step):
+            count = min(step, odds - first)
+            segment = _odd_segment(2 * first + 1, count, primes)
+            packed = np.packbits(segment, bitorder='little')
+            self._bits[first // 8:first // 8 + len(packed)] = packed
+
+    def __contains__(self, n):
+        return self.is_prime(n)
+
+    def is_prime(self, n: int) -> bool:
+        _require_int(n)
+        if n > self.limit:
+            raise ValueError(f"{n} is above the sieve limit {self.limit}")
+        if n < 3:
+            return n == 2
+        if n % 2 == 0:
+            return False
+        i = n // 2
+        return bool(self._bits[i >> 3] >> (i & 7) & 1)
+
+    def is_prime_many(self, values) -> np.ndarray:
+        """Vectorized lookup for an integer array with every value <= limit."""
+        values = np.asarray(values, dtype=np.int64)
+        if values.size and values.max() > self.limit:
+            raise ValueError(f"values above the sieve limit {self.limit}")
+        i = np.maximum(values, 0) // 2
+        odd_prime = (self._bits[i >> 3] >> (i & 7).astype(np.uint8) & 1).astype(bool)
+        return np.where(values % 2 == 1, odd_prime & (values > 1), values == 2)
+
+
+_shared_sieve = None
+
+
+def _sieve_for(limit):
+    """A cached sieve covering limit, grown (doubling) as needed."""
+    global _shared_sieve
+    if _shared_sieve is None or _shared_sieve.limit < limit:
+        size = max(limit, 2 * _shared_sieve.limit if _shared_sieve else 1 << 16)
+        _shared_sieve = PrimeSieve(min(size, max(limit, SIEVE_LIMIT)))
+    return _shared_sieve
+
+
+def _miller_rabin(n: int, bases) -> bool:
+    """False if any base proves the odd number n > 2 composite."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_probable_prime(n: int, rounds: int = PROBABLE_PRIME_ROUNDS) -> bool:
+    """
+    Miller-Rabin test. Exact for n < 2^64; above that a composite passes
+    with probability below 4^-rounds.
+    """
+    _require_int(n)
+    n = int(n)
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    if n <= SMALL_PRIMES[-1]:
+        return n in SMALL_PRIMES
+    # One gcd rejects most composites before any modular exponentiation
+    if math.gcd(n, SMALL_PRIMES_PRODUCT) != 1:
+        return False
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+    if n < 1 << 64:
+        return _miller_rabin(n, DETERMINISTIC_BASES)
+    bases = [2] + [random.randrange(3, n - 1) for _ in range(rounds - 1)]
+    return _miller_rabin(n, bases)
+
+
+def is_prime(n: int) -> bool:
+    """
+    Same answer as is_prime in Task 2.py (for n >= 2^64, with probability
+    of error below 4^-40).
+    """
+    _require_int(n)
+    if n < 2:
+        return False
+    if _shared_sieve is not None and n <= _shared_sieve.limit:
+        return _shared_sieve.is_prime(n)
+    return is_probable_prime(n)
+
+
+def is_prime_many(values) -> np.ndarray:
+    """
+    Primality of every value, as a boolean array of the same shape. Values
+    up to SIEVE_LIMIT are looked up in a shared sieve when one covers them
+    or the batch is large and dense enough to pay for building it; other
+    values are tested one by one with is_prime.
+    """
+    array = np.asarray(values)
+    if array.dtype == object:
+        for v in array.flat:
+            _require_int(v)
+        # Compare as Python ints; values of any size must stay out of int64
+        candidate = np.array([v >= 2 for v in array.flat], dtype=bool).reshape(array.shape)
+        small = np.array([v <= SIEVE_LIMIT for v in array.flat], dtype=bool).reshape(array.shape)
+    elif np.issubdtype(array.dtype, np.integer) or array.dtype == bool:
+        candidate, small = array >= 2, array <= SIEVE_LIMIT
+    else:
+        raise TypeError("is_prime() requires an integer")
+    # Values below 2 are not prime and stay False
+    result = np.zeros(array.shape, dtype=bool)
+    small &= candidate
+    if small.any():
+        lookup = array[small].astype(np.int64)
+        top = int(lookup.max())
+        covered = _shared_sieve is not None and top <= _shared_sieve.limit
+        if covered or SIEVE_MIN_BATCH <= len(lookup) and top <= SIEVE_PAYOFF * len(lookup):
+            result[small] = _sieve_for(top).is_prime_many(lookup)
+        else:
+            small[...] = False
+    for index in zip(*np.nonzero(candidate & ~small)):
+        result[index] = is_prime(int(array[index]))
+    return result
+
+
+def _count_range(bounds):
+    lo, hi = bounds
+    return sum(len(primes) for primes in iter_prime_segments(lo, hi))
+
+
+def count_primes(lo: int, hi: int, workers: int = None) -> int:
+    """Count the primes in [lo, hi), sieving slices of the range in worker processes."""
+    lo = max(lo, 0)
+    if hi <= lo:
+        return 0
+    workers = workers or os.cpu_count()
+    # Several slices per worker keep the pool busy when slices finish unevenly;
+    # each slice is at least a few segments, so the per-slice setup stays small
+    slices = min(4 * workers, max(1, (hi - lo) // (4 * SEGMENT_SIZE)))
+    edges = [lo + (hi - lo) * k // slices for k in range(slices + 1)]
+    ranges = list(zip(edges[:-1], edges[1:]))
+    if workers == 1 or slices == 1:
+        return sum(map(_count_range, ranges))
+    with ProcessPoolExecutor(workers) as pool:
+        return sum(pool.map(_count_range, ranges))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prime engine")
+    commands = parser.add_subparsers(dest="command", required=True)
+    between = commands.add_parser("between", help="list (or count) the primes in [lo, hi)")
+    between.add_argument("lo", type=int)
+    between.add_argument("hi", type=int)
+    between.add_argument("--count", action='store_true', help="print only how many there are")
+    test = commands.add_parser("test", help="test numbers for primality")
+    test.add_argument("numbers", type=int, nargs='+')
+    count = commands.add_parser("count", help="count the primes in [lo, hi) in parallel")
+    count.add_argument("lo", type=int)
+    count.add_argument("hi", type=int)
+    count.add_argument("--workers", type=int, default=None,
+                       help="worker processes (default: all CPUs)")
+    args = parser.parse_args()
+
+    if args.command == "between":
+        if args.count:
+            print(sum(len(primes) for primes in iter_prime_segments(args.lo, args.hi)))
+        else:
+            for primes in iter_prime_segments(args.lo, args.hi):
+                if len(primes):
+                    print("\n".join(map(str, primes.tolist())))
+    elif args.command == "count":
+        start = time.perf_counter()
+        total = count_primes(args.lo, args.hi, args.workers)
+        print(f"{total} primes in [{args.lo}, {args.hi}) "
+              f"({time.perf_counter() - start:.2f}s)")
+    else:
+        for n, prime in zip(args.numbers, is_prime_many(np.array(args.numbers, dtype=object))):
+            print(f"{n} is prime." if prime else f"{n} is not prime.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 from pulp import LpMaximize, LpProblem, LpVariable, value
 
+from small_ip import solve_small
+
 # Define the optimization problem
 model = LpProblem("Chocolate_Profit_Maximization", LpMaximize)
 
@@ -14,8 +16,8 @@ model += 3*x + 2*y <= 12     # Choco constraint
 # Define objective function
 model += 6*x + 5*y           # Profit function
 
-# Solve the problem
-model.solve()
+# Solve the problem (in-process for a model this small, CBC for large ones)
+solve_small(model)
 
 # Output results
 print("Optimal Production Plan:")
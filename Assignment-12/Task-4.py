@@ -5,12 +5,14 @@ def df(x):
     # Derivative of f(x): f'(x) = 6x^2 + 4
     return 6 * x**2 + 4
 
-def gradient_descent(x0, learning_rate, iterations):
+def gradient_descent(x0, learning_rate, iterations, log_every=1):
+    # Print every log_every-th iteration (0 = never); printing dominates long runs
     x = x0
     for i in range(iterations):
         grad = df(x)
         x = x - learning_rate * grad
-        print(f"Iteration {i+1}: x = {x:.6f}, f(x) = {f(x):.6f}")
+        if log_every and (i + 1) % log_every == 0:
+            print(f"Iteration {i+1}: x = {x:.6f}, f(x) = {f(x):.6f}")
     return x
 
 # Main program
@@ -0,0 +1,139 @@
+"""
+Batched multi-start gradient descent for f and df from Task-4.py.
+
+Thousands of (x0, learning_rate) pairs advance together as NumPy arrays:
+one vectorized update per iteration covers every row that is still
+running. Each row stops on its own when
+
+- it converges: the step |learning_rate * df(x)| falls to its tolerance;
+- it diverges: x leaves [-max_abs, max_abs] or stops being finite.
+
+The loop ends as soon as no row is running. Progress is printed as one
+summary line every log_every iterations instead of a line per step.
+
+Usage:
+    python batch_descent.py --starts 10000 --x-range -5 5 --learning-rates 1e-3 1e-2 \\
+        --iterations 1000000 --log-every 100000
+"""
+import argparse
+import importlib
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+task4 = importlib.import_module("Task-4")
+
+RUNNING, CONVERGED, DIVERGED = 0, 1, 2
+STATUS_NAMES = ('running', 'converged', 'diverged')
+
+
+@dataclass
+class BatchResult:
+    """Final state of every row of a batched descent."""
+    x: np.ndarray
+    fx: np.ndarray
+    iterations: np.ndarray  # iterations each row ran
+    status: np.ndarray  # RUNNING (hit the iteration limit), CONVERGED or DIVERGED
+    elapsed: float = 0.0
+
+    def counts(self):
+        return {name: int((self.status == code).sum()) for code, name in enumerate(STATUS_NAMES)}
+
+    def summary(self):
+        counts = self.counts()
+        steps = int(self.iterations.sum())
+        rate = steps / self.elapsed if self.elapsed else 0.0
+        return (f"{len(self.x)} rows: {counts['converged']} converged, "
+                f"{counts['diverged']} diverged, {counts['running']} hit the iteration limit; "
+                f"{steps:,} row-steps in {self.elapsed:.2f}s ({rate:,.0f} steps/sec)")
+
+
+def batch_gradient_descent(x0, learning_rate, iterations, tol=1e-10, max_abs=1e12,
+                           log_every=0, func=None, grad=None):
+    """
+    Run gradient descent from every (x0, learning_rate) pair at once.
+    x0, learning_rate and tol broadcast against each other, so a scalar
+    learning rate or tolerance applies to every row. func and grad default
+    to f and df from Task-4.py and must accept NumPy arrays.
+    """
+    func = func or task4.f
+    grad = grad or task4.df
+    x0, learning_rate, tol = np.broadcast_arrays(np.asarray(x0, dtype=float),
+                                                 np.asarray(learning_rate, dtype=float),
+                                                 np.asarray(tol, dtype=float))
+    x = x0.ravel().copy()
+    rate = learning_rate.ravel()
+    tol = tol.ravel()
+    ran = np.zeros(len(x), dtype=np.int64)
+    status = np.full(len(x), RUNNING, dtype=np.int8)
+    # Indices of the rows still running; shrinks as rows finish
+    active = np.flatnonzero(np.isfinite(x))
+    status[~np.isfinite(x)] = DIVERGED
+
+    start = time.perf_counter()
+    with np.errstate(over='ignore', invalid='ignore'):
+        for i in range(1, iterations + 1):
+            if not len(active):
+                break
+            xa = x[active]
+            step = rate[active] * grad(xa)
+            xa -= step
+            x[active] = xa
+            converged = np.abs(step) <= tol[active]
+            diverged = ~(np.abs(xa) <= max_abs)  # also catches inf and nan
+            done = converged | diverged
+            if done.any():
+                finished = active[done]
+                ran[finished] = i
+                status[active[converged & ~diverged]] = CONVERGED
+                status[active[diverged]] = DIVERGED
+                active = active[~done]
+            if log_every and i % log_every == 0:
+                fa = func(x[active])
+                best = f"{fa.min():.6f}" if len(fa) else "-"
+                print(f"Iteration {i}: {len(active)} running, "
+                      f"{int((status == CONVERGED).sum())} converged, "
+                      f"{int((status == DIVERGED).sum())} diverged, best running f(x) = {best}")
+        ran[active] = iterations  # rows still running used every iteration
+        fx = func(x)
+    shape = x0.shape
+    return BatchResult(x.reshape(shape), fx.reshape(shape), ran.reshape(shape),
+                       status.reshape(shape), time.perf_counter() - start)
+
+
+def make_starts(n, x_range, learning_rates, seed=0):
+    """Every one of n random starting points in x_range with every learning rate."""
+    x0 = np.random.default_rng(seed).uniform(x_range[0], x_range[1], n)
+    return np.repeat(x0, len(learning_rates)), np.tile(learning_rates, n)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched multi-start gradient descent")
+    parser.add_argument("--starts", type=int, default=1000, help="random starting points")
+    parser.add_argument("--x-range", type=float, nargs=2, default=(-5.0, 5.0))
+    parser.add_argument("--learning-rates", type=float, nargs='+', default=[0.01])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--tol", type=float, default=1e-10, help="step-size tolerance")
+    parser.add_argument("--max-abs", type=float, default=1e12,
+                        help="|x| beyond which a row counts as diverged")
+    parser.add_argument("--log-every", type=int, default=0,
+                        help="print a summary every N iterations (0 = never)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    x0, rates = make_starts(args.starts, args.x_range, args.learning_rates, args.seed)
+    result = batch_gradient_descent(x0, rates, args.iterations, args.tol, args.max_abs,
+                                    args.log_every)
+    print(result.summary())
+    finite = np.isfinite(result.fx) & (result.status != DIVERGED)
+    if finite.any():
+        best = np.flatnonzero(finite)[np.argmin(result.fx[finite])]
+        print(f"Best: x0 = {x0[best]:.6f}, learning rate = {rates[best]:g} -> "
+              f"x = {result.x[best]:.6f}, f(x) = {result.fx[best]:.6f}")
+    else:
+        print("Every row diverged: f has no minimum reachable from these starts.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark: scaling of parallel_sort from 1 to 32 worker processes.
+
+The 1-core baseline is NumPy's sort in this process (the fastest serial
+sort here). For p workers, speedup = t1 / tp and efficiency = speedup / p.
+Each worker count gets its own warmed-up pool, so process start-up is not
+timed. Worker counts above os.cpu_count() are still run but marked, since
+they cannot speed anything up.
+
+Usage:
+    python bench_parallel_sort.py --size 1e8 --workers 1 2 4 8 16 32
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from parallel_sort import make_pool, parallel_sort
+
+
+def best_of(repeat, fn):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel sample sort scaling benchmark")
+    parser.add_argument("--size", type=float, default=1e8)
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    n = int(args.size)
+    array = np.random.default_rng(args.seed).integers(-2 ** 62, 2 ** 62, n)
+    cpus = os.cpu_count()
+    print(f"n = {n:,} int64, {cpus} CPUs")
+
+    serial = best_of(args.repeat, lambda: np.sort(array))
+    print(f"{'workers':>8}{'time':>10}{'speedup':>10}{'efficiency':>12}")
+    print(f"{'serial':>8}{serial:>9.3f}s{1:>10.2f}{1:>12.0%}")
+    for workers in args.workers:
+        with make_pool(workers) as pool:
+            list(pool.map(abs, range(workers)))  # start every worker before timing
+            elapsed = best_of(args.repeat, lambda: parallel_sort(array, workers, pool))
+        speedup = serial / elapsed
+        note = "  (more workers than CPUs)" if workers > cpus else ""
+        print(f"{workers:>8}{elapsed:>9.3f}s{speedup:>10.2f}{speedup / workers:>12.0%}{note}")
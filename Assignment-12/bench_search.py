@@ -0,0 +1,58 @@
+"""
+Benchmark: repeated linear_search (Task-1.py) against a SearchIndex.
+
+For each list size, times linear_search per query, the one-off index build
+and the indexed lookups, then reports the crossover: the number of queries
+after which building the index has paid for itself.
+
+Usage:
+    python bench_search.py --sizes 1000 10000 100000 1000000
+"""
+import argparse
+import importlib
+import random
+import time
+
+import numpy as np
+
+from search_index import SearchIndex
+
+linear_search = importlib.import_module("Task-1").linear_search
+
+
+def per_query(fn, queries):
+    start = time.perf_counter()
+    fn(queries)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def bench(n, queries, mode, seed=0):
+    rng = random.Random(seed)
+    data = [rng.randrange(2 * n) for _ in range(n)]
+    targets = [rng.randrange(2 * n) for _ in range(queries)]
+    seq = np.array(data) if mode == 'numpy' else data
+
+    # linear_search is O(n) per query, so time it on a sample of about 2e7 element visits
+    sample = targets[:max(1, min(queries, 20_000_000 // n))]
+    linear = per_query(lambda qs: [linear_search(data, t) for t in qs], sample)
+    start = time.perf_counter()
+    index = SearchIndex(seq, mode=mode)
+    build = time.perf_counter() - start
+    indexed = per_query(index.search_many, targets)
+    crossover = build / (linear - indexed) if linear > indexed else float('inf')
+    return linear, build, indexed, crossover
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="linear_search vs SearchIndex")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[100, 1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=100_000,
+                        help="lookups timed against the index (default: 100000)")
+    args = parser.parse_args()
+
+    print(f"{'n':>10}{'mode':>7}{'linear/query':>15}{'build':>12}{'index/query':>14}{'crossover':>14}")
+    for n in args.sizes:
+        for mode in ('hash', 'numpy'):
+            linear, build, indexed, crossover = bench(n, args.queries, mode)
+            print(f"{n:>10}{mode:>7}{linear * 1e6:>13.2f}us{build * 1e3:>10.2f}ms"
+                  f"{indexed * 1e6:>12.3f}us{crossover:>10.0f} queries")
@@ -0,0 +1,75 @@
+"""
+Benchmark: latency per solve of the Task-3.py model with CBC (model.solve())
+against solve_small() from small_ip.py.
+
+Besides the chocolate model, random production plans of a few sizes are
+timed to show where the in-process path stops paying off; solve_small()
+is timed both as configured (falling back to CBC above SMALL_MODEL_SIZE)
+and forced in-process. Objective values should agree.
+
+Usage:
+    python bench_small_ip.py --repeat 200 --sizes 4 6 8 10
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+from pulp import PULP_CBC_CMD, value
+
+from production_model import build_model, chocolate_plan, plan_from_rows
+from small_ip import MAX_NODES, solve_small
+
+
+def random_plan(n, rng):
+    """n integer products over n resources, each product using about 3 of them."""
+    products = [(f"p{i}", round(rng.uniform(1, 10), 2)) for i in range(n)]
+    usage = [(f"p{i}", f"r{r}", round(rng.uniform(0.5, 5), 2))
+             for i in range(n) for r in rng.choice(n, min(3, n), replace=False)]
+    capacities = [(f"r{r}", round(rng.uniform(10, 50), 1)) for r in range(n)]
+    return plan_from_rows(products, usage, capacities)
+
+
+def latencies(plan, solve, repeat):
+    times, objective = [], None
+    for _ in range(repeat):
+        model, _ = build_model(plan)
+        start = time.perf_counter()
+        solve(model)
+        times.append(time.perf_counter() - start)
+        objective = value(model.objective)
+    return times, objective
+
+
+def describe(times):
+    times = sorted(times)
+    p95 = times[min(len(times) - 1, int(0.95 * len(times)))]
+    return f"{statistics.mean(times) * 1e3:8.2f} {statistics.median(times) * 1e3:8.2f} {p95 * 1e3:8.2f}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CBC vs in-process solve latency")
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--sizes", type=int, nargs='*', default=[4, 6, 8, 10],
+                        help="sizes of extra random plans (products = resources)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    cases = [("chocolate (Task-3)", chocolate_plan())]
+    cases += [(f"random {n}x{n}", random_plan(n, rng)) for n in args.sizes]
+    cbc = PULP_CBC_CMD(msg=False)
+    paths = {
+        'cbc': lambda m: m.solve(cbc),
+        'solve_small': solve_small,
+        'in-process': lambda m: solve_small(m, max_size=float('inf'), max_nodes=100 * MAX_NODES),
+    }
+
+    print(f"{'model':>20} {'path':>12} {'mean ms':>8} {'median':>8} {'p95':>8}  objective")
+    for name, plan in cases:
+        results = {path: latencies(plan, solve, args.repeat) for path, solve in paths.items()}
+        cbc_median = statistics.median(results['cbc'][0])
+        for path, (times, objective) in results.items():
+            speedup = cbc_median / statistics.median(times)
+            print(f"{name if path == 'cbc' else '':>20} {path:>12} {describe(times)}  "
+                  f"{objective}  ({speedup:.2g}x vs cbc)")
@@ -0,0 +1,71 @@
+"""
+Benchmark: bubble_sort (Task-2.py) against the sorting engine.
+
+Inputs are random, sorted, reversed and few-unique integer sequences.
+bubble_sort, adaptive_sort and sort get Python lists; radix_sort and
+sort_array get int64 NumPy arrays. Each path is skipped above the size
+where it stops being practical.
+
+Usage:
+    python bench_sorting.py --sizes 1e3 1e4 1e5 1e6 1e7 1e8
+"""
+import argparse
+import importlib
+import time
+
+import numpy as np
+
+from sorting import adaptive_sort, radix_sort, sort, sort_array
+
+bubble_sort = importlib.import_module("Task-2").bubble_sort
+
+DISTRIBUTIONS = ('random', 'sorted', 'reversed', 'few-unique')
+
+
+def make_input(distribution, n, rng):
+    if distribution == 'random':
+        return rng.integers(-2 ** 31, 2 ** 31, n)
+    if distribution == 'sorted':
+        return np.arange(n)
+    if distribution == 'reversed':
+        return np.arange(n)[::-1].copy()
+    return rng.integers(0, 8, n)
+
+
+# name -> (function, takes a list?, default size limit)
+PATHS = {
+    'bubble_sort': (lambda items: bubble_sort(items), True, 1e4),
+    'adaptive_sort': (adaptive_sort, True, 1e7),
+    'sort': (sort, True, 1e7),
+    'radix_sort': (radix_sort, False, 1e8),
+    'sort_array': (sort_array, False, 1e8),
+}
+
+
+def timed(fn, data):
+    start = time.perf_counter()
+    fn(data)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sorting benchmark")
+    parser.add_argument("--sizes", type=float, nargs='+', default=[1e3, 1e4, 1e5, 1e6, 1e7, 1e8])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'n':>11}{'input':>12}" + "".join(f"{name:>15}" for name in PATHS))
+    for n in (int(size) for size in args.sizes):
+        for distribution in DISTRIBUTIONS:
+            array = make_input(distribution, n, rng)
+            as_list = array.tolist() if n <= max(limit for _, takes_list, limit in PATHS.values()
+                                                 if takes_list) else None
+            cells = []
+            for name, (fn, takes_list, limit) in PATHS.items():
+                if n > limit:
+                    cells.append("-")
+                    continue
+                data = list(as_list) if takes_list else array
+                cells.append(f"{timed(fn, data):.4f}s")
+            print(f"{n:>11}{distribution:>12}" + "".join(f"{cell:>15}" for cell in cells))
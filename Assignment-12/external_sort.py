@@ -0,0 +1,230 @@
+"""
+External merge sort for text files of integers larger than RAM.
+
+The input holds integers separated by any whitespace (spaces or newlines, as
+typed for bubble_sort in Task-2.py). The output has one integer per line.
+
+1. Run generation: read the input in blocks, parse them into a preallocated
+   int64 run buffer of half the memory budget, sort it in place and spill
+   it to a binary temp file. (Equal integers are indistinguishable, so the
+   in-place sort needs neither sort_array's stability nor its copy.)
+2. Merge: a k-way merge over all runs, block by block. A heap keyed on the
+   largest value in each run's read buffer gives the bound up to which
+   every run's buffered values can be emitted, so each step is one
+   vectorized sort of a bounded slice (about MERGE_BLOCK integers, or
+   fewer under a small budget) instead of one heap push per integer.
+   If there are more runs than --max-fan-in, runs are merged in passes.
+
+Usage:
+    python external_sort.py numbers.txt -o sorted.txt --memory 1G --tmp-dir /scratch
+"""
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ITEM_SIZE = np.dtype(np.int64).itemsize
+PARSE_BLOCK = 8 << 20  # bytes of text parsed at a time
+IO_BUFFER = 4 << 20
+MERGE_BLOCK = 1 << 20  # most integers emitted per merge step
+WRITE_SLICE = 1 << 14  # integers formatted as text at a time
+
+
+def parse_size(text):
+    """Parse a size such as 512M, 1G or 65536 into bytes."""
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+    text = text.strip().upper().rstrip('B')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def _parse_ints(text, path):
+    try:
+        return np.fromiter(map(int, text.split()), dtype=np.int64)
+    except OverflowError:
+        raise OverflowError(f"{path}: integer does not fit in 64 bits") from None
+
+
+def read_int_blocks(path, block_size=PARSE_BLOCK):
+    """Yield int64 arrays parsed from a whitespace-separated text file, block by block."""
+    with open(path, 'rb', buffering=IO_BUFFER) as file:
+        tail = b''
+        while True:
+            block = file.read(block_size)
+            if not block:
+                break
+            block = tail + block
+            # Keep a number that straddles the block boundary for the next block
+            cut = max(block.rfind(b' '), block.rfind(b'\n'), block.rfind(b'\t'), block.rfind(b'\r'))
+            if cut == -1:
+                tail = block
+                continue
+            tail = block[cut + 1:]
+            yield _parse_ints(block[:cut], path)
+        if tail.strip():
+            yield _parse_ints(tail, path)
+
+
+def make_runs(path, memory, tmp_dir):
+    """Split the input into sorted binary run files of up to memory/2 bytes each."""
+    # The run buffer takes half the budget; the rest is for the text being
+    # parsed, its split tokens and Python ints
+    run_ints = max(1, memory // (2 * ITEM_SIZE))
+    buffer = np.empty(run_ints, dtype=np.int64)
+    runs, count = [], 0
+
+    def spill():
+        run = buffer[:count]
+        run.sort()
+        fd, run_path = tempfile.mkstemp(suffix='.run', dir=tmp_dir)
+        with os.fdopen(fd, 'wb') as out:
+            run.tofile(out)
+        runs.append(run_path)
+
+    # Each byte of text costs about ten bytes once split into tokens
+    for block in read_int_blocks(path, min(PARSE_BLOCK, max(1 << 12, memory // 64))):
+        while len(block):
+            take = block[:run_ints - count]
+            buffer[count:count + len(take)] = take
+            count += len(take)
+            block = block[len(take):]
+            if count == run_ints:
+                spill()
+                count = 0
+    if count:
+        spill()
+    return runs
+
+
+class RunReader:
+    """Buffered reader over one binary run file."""
+
+    def __init__(self, path, block_ints):
+        self.file = open(path, 'rb', buffering=0)
+        self.block_ints = block_ints
+        self.buffer = np.empty(0, dtype=np.int64)
+        self.pos = 0
+        self.refill()
+
+    def refill(self):
+        self.buffer = np.fromfile(self.file, dtype=np.int64, count=self.block_ints)
+        self.pos = 0
+        if not len(self.buffer):
+            self.file.close()
+        return len(self.buffer) > 0
+
+
+def merge_runs(run_paths, write, memory):
+    """k-way merge of sorted run files; calls write(array) with sorted blocks."""
+    # A quarter of the budget for the read buffers and an eighth for each
+    # step's merged block of about out_ints values, sorted in place; the
+    # rest covers write(), which may format the block as text, and the
+    # memory the parsing of the input left behind
+    block_ints = max(1024, memory // (4 * ITEM_SIZE * max(1, len(run_paths))))
+    out_ints = max(1024, min(MERGE_BLOCK, memory // (8 * ITEM_SIZE)))
+    readers = [RunReader(path, block_ints) for path in run_paths]
+    heap = [(int(r.buffer[-1]), k) for k, r in enumerate(readers) if len(r.buffer)]
+    heapq.heapify(heap)
+    active = {k for _, k in heap}
+
+    while heap:
+        rests = [(readers[k], readers[k].buffer[readers[k].pos:]) for k in active]
+        bound = heap[0][0]
+        if sum(len(rest) for _, rest in rests) > out_ints:
+            # Lower the bound so each run gives up about its share of out_ints
+            share = max(1, out_ints // len(rests))
+            bound = min(bound, min(int(rest[min(share, len(rest)) - 1])
+                                   for _, rest in rests if len(rest)))
+        parts = []
+        for reader, rest in rests:
+            take = np.searchsorted(rest, bound, side='right')
+            if take:
+                parts.append(rest[:take])
+                reader.pos += take
+        block = np.concatenate(parts)
+        block.sort()
+        write(block)
+        del block  # free it before the next step's block is built
+        # Every run whose buffer ended at the bound is now exhausted. Pop them
+        # all before refilling, as a refill may end at the same value again
+        exhausted = []
+        while heap and heap[0][0] == bound:
+            exhausted.append(heapq.heappop(heap)[1])
+        for k in exhausted:
+            if readers[k].refill():
+                heapq.heappush(heap, (int(readers[k].buffer[-1]), k))
+            else:
+                active.discard(k)
+
+
+def write_binary_run(tmp_dir):
+    fd, path = tempfile.mkstemp(suffix='.run', dir=tmp_dir)
+    file = os.fdopen(fd, 'wb', buffering=IO_BUFFER)
+    return path, file
+
+
+def external_sort(input_path, output_path, memory=1 << 30, tmp_dir=None, max_fan_in=256):
+    """Sort the integers in input_path into output_path using about `memory` bytes."""
+    stats = {'runs': 0, 'merge_passes': 0, 'integers': 0}
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='extsort_', dir=tmp_dir) as work_dir:
+        runs = make_runs(input_path, memory, work_dir)
+        stats['runs'] = len(runs)
+        stats['run_seconds'] = round(time.perf_counter() - start, 3)
+
+        # Intermediate passes until the remaining runs fit in one merge
+        while len(runs) > max_fan_in:
+            next_runs = []
+            for lo in range(0, len(runs), max_fan_in):
+                group = runs[lo:lo + max_fan_in]
+                path, file = write_binary_run(work_dir)
+                with file:
+                    merge_runs(group, lambda block: block.tofile(file), memory)
+                for done in group:
+                    os.remove(done)
+                next_runs.append(path)
+            runs = next_runs
+            stats['merge_passes'] += 1
+
+        with open(output_path, 'w', buffering=IO_BUFFER) as out:
+            def write(block):
+                stats['integers'] += len(block)
+                # Format in slices so the text and its Python ints stay small
+                for lo in range(0, len(block), WRITE_SLICE):
+                    out.write('\n'.join(map(str, block[lo:lo + WRITE_SLICE].tolist())))
+                    out.write('\n')
+            merge_runs(runs, write, memory)
+        stats['merge_passes'] += 1
+    stats['seconds'] = round(time.perf_counter() - start, 3)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="External merge sort for integer files")
+    parser.add_argument("input", help="text file of whitespace-separated integers")
+    parser.add_argument("-o", "--output", required=True, help="sorted output file")
+    parser.add_argument("--memory", default="1G",
+                        help="memory budget, e.g. 512M or 1G (default: 1G)")
+    parser.add_argument("--tmp-dir", default=None,
+                        help="directory for run files (default: the system temp dir)")
+    parser.add_argument("--max-fan-in", type=int, default=256,
+                        help="most runs merged at once (default: 256)")
+    args = parser.parse_args()
+
+    try:
+        memory = parse_size(args.memory)
+        stats = external_sort(args.input, args.output, memory, args.tmp_dir, args.max_fan_in)
+    except (ValueError, OverflowError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"Sorted {stats['integers']} integers in {stats['seconds']}s "
+          f"({stats['runs']} runs, {stats['merge_passes']} merge passes)")
+
+
+if __name__ == "__main__":
+    main()
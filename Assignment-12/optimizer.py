@@ -0,0 +1,376 @@
+"""
+Gradient-based minimizer for user-supplied functions.
+
+Task-4.py's gradient_descent only knows its own f and df. Here the function
+can be:
+
+- an expression string over one or more variables, e.g. "x**4 - 3*x**3 + 2"
+  or "(x - 1)**2 + 10*(y - x**2)**2". Polynomials are expanded and
+  differentiated exactly; anything else (sin, exp, division by a variable,
+  ...) gets central finite differences. Expressions may use + - * / **,
+  unary minus, numbers, the math functions in FUNCTIONS and CONSTANTS;
+  anything else is rejected with a ValueError;
+- any Python callable taking the variables as arguments, differentiated by
+  finite differences.
+
+Value and gradient are compiled once into plain Python lambdas (Horner's
+rule for one-variable polynomials), so each evaluation is a single call.
+
+Methods: 'gd' (fixed step, like Task-4.py), 'momentum' and 'adam', each
+optionally with a backtracking (Armijo) line search.
+
+Usage:
+    python optimizer.py "x**4 - 3*x**3 + 2" --x0 4 --method gd --line-search
+    python optimizer.py "x**4 - 3*x**3 + 2" --x0 4 --compare
+"""
+import argparse
+import ast
+import math
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+METHODS = ('gd', 'momentum', 'adam')
+FUNCTIONS = {name: getattr(math, name) for name in (
+    'sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'sinh', 'cosh', 'tanh',
+    'exp', 'log', 'log10', 'sqrt')}
+FUNCTIONS['abs'] = abs
+CONSTANTS = {'pi': math.pi, 'e': math.e}
+FD_STEP = 1e-6  # relative step for central differences
+
+
+class NotPolynomial(Exception):
+    pass
+
+
+# Polynomials are dicts {exponent tuple: coefficient}, one exponent per variable
+def _poly_add(a, b, sign=1):
+    result = dict(a)
+    for exps, coef in b.items():
+        result[exps] = result.get(exps, 0) + sign * coef
+    return {exps: coef for exps, coef in result.items() if coef != 0}
+
+
+def _poly_mul(a, b):
+    result = {}
+    for ea, ca in a.items():
+        for eb, cb in b.items():
+            exps = tuple(i + j for i, j in zip(ea, eb))
+            result[exps] = result.get(exps, 0) + ca * cb
+    return {exps: coef for exps, coef in result.items() if coef != 0}
+
+
+def _poly_const(value, n):
+    return {(0,) * n: value} if value else {}
+
+
+def _to_poly(node, variables):
+    """Expand an expression AST into a polynomial, or raise NotPolynomial."""
+    n = len(variables)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return _poly_const(node.value, n)
+    if isinstance(node, ast.Name):
+        if node.id in CONSTANTS:
+            return _poly_const(CONSTANTS[node.id], n)
+        exps = [0] * n
+        exps[variables.index(node.id)] = 1
+        return {tuple(exps): 1}
+    if isinstance(node, ast.UnaryOp):
+        operand = _to_poly(node.operand, variables)
+        if isinstance(node.op, ast.USub):
+            return _poly_add({}, operand, -1)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+    if isinstance(node, ast.BinOp):
+        left = _to_poly(node.left, variables)
+        if isinstance(node.op, ast.Pow):
+            power = _constant(node.right)
+            if power is None or power < 0 or power != int(power):
+                raise NotPolynomial
+            result = _poly_const(1, n)
+            for _ in range(int(power)):
+                result = _poly_mul(result, left)
+            return result
+        right = _to_poly(node.right, variables)
+        if isinstance(node.op, ast.Add):
+            return _poly_add(left, right)
+        if isinstance(node.op, ast.Sub):
+            return _poly_add(left, right, -1)
+        if isinstance(node.op, ast.Mult):
+            return _poly_mul(left, right)
+        if isinstance(node.op, ast.Div):
+            divisor = _constant(node.right)
+            if not divisor:
+                raise NotPolynomial
+            return {exps: coef / divisor for exps, coef in left.items()}
+    raise NotPolynomial
+
+
+def _constant(node):
+    """The value of a constant subexpression, else None."""
+    try:
+        value = _to_poly(node, [])
+    except (NotPolynomial, ValueError):
+        return None
+    return value.get((), 0)
+
+
+def _poly_derivative(poly, k):
+    result = {}
+    for exps, coef in poly.items():
+        if exps[k]:
+            lowered = exps[:k] + (exps[k] - 1,) + exps[k + 1:]
+            result[lowered] = result.get(lowered, 0) + coef * exps[k]
+    return result
+
+
+def _poly_source(poly, variables):
+    """Python source for a polynomial: Horner's rule for one variable, else a sum of terms."""
+    if not poly:
+        return "0.0"
+    if len(variables) == 1:
+        (name,) = variables
+        degree = max(exps[0] for exps in poly)
+        source = repr(float(poly.get((degree,), 0)))
+        for power in range(degree - 1, -1, -1):
+            coef = float(poly.get((power,), 0))
+            source = f"({source}) * {name}" + (f" + {coef!r}" if coef else "")
+        return source
+    terms = []
+    for exps, coef in sorted(poly.items()):
+        factors = [repr(float(coef))] + [name if e == 1 else f"{name} ** {e}"
+                                         for name, e in zip(variables, exps) if e]
+        terms.append(" * ".join(factors))
+    return " + ".join(terms)
+
+
+def _compile(source, variables):
+    namespace = {'__builtins__': {}, **FUNCTIONS, **CONSTANTS}
+    return eval(f"lambda {', '.join(variables)}: {source}", namespace)
+
+
+def _check_expression(tree):
+    allowed = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load,
+               ast.Call, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.UAdd, ast.USub)
+    variables = set()
+    called = set()  # the Name nodes that are the function of a call
+    for node in ast.walk(tree):
+        if not isinstance(node, allowed):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Call):
+            if not (isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS
+                    and len(node.args) == 1 and not node.keywords):
+                raise ValueError(f"unsupported call: {ast.unparse(node)}")
+            called.add(node.func)
+        elif isinstance(node, ast.Name) and node.id in FUNCTIONS:
+            if node not in called:
+                raise ValueError(f"function {node.id!r} used without arguments")
+        elif isinstance(node, ast.Name) and node.id not in CONSTANTS:
+            variables.add(node.id)
+        elif isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"unsupported constant: {node.value!r}")
+    return sorted(variables)
+
+
+class Objective:
+    """
+    A function to minimize with its gradient, compiled once. Counts value
+    evaluations (f_evals) and gradient evaluations (grad_evals); finite
+    differences also add their 2n value evaluations to f_evals.
+    """
+
+    def __init__(self, func, variables=None, fd_step=FD_STEP):
+        self.fd_step = fd_step
+        self.f_evals = 0
+        self.grad_evals = 0
+        self.symbolic = False
+        self.gradient_source = None
+        self._grad = None
+        if callable(func):
+            self.expression = getattr(func, '__name__', 'function')
+            self.variables = list(variables) if variables else None
+            self._value = func
+            return
+        self.expression = func
+        tree = ast.parse(func, mode='eval')
+        found = _check_expression(tree)
+        self.variables = list(variables) if variables else found
+        if not self.variables:
+            raise ValueError("expression has no variables")
+        missing = set(found) - set(self.variables)
+        if missing:
+            raise ValueError(f"unknown names in expression: {', '.join(sorted(missing))}")
+        try:
+            poly = _to_poly(tree.body, self.variables)
+        except NotPolynomial:
+            self._value = _compile(ast.unparse(tree), self.variables)
+            return
+        self.symbolic = True
+        self._value = _compile(_poly_source(poly, self.variables), self.variables)
+        derivatives = [_poly_source(_poly_derivative(poly, k), self.variables)
+                       for k in range(len(self.variables))]
+        self.gradient_source = derivatives
+        self._grad = _compile(f"({', '.join(derivatives)},)", self.variables)
+
+    def _call(self, x):
+        try:
+            return float(self._value(*x))
+        except (ValueError, OverflowError, ZeroDivisionError):
+            return math.inf  # outside the domain (log of a negative, ...)
+
+    def value(self, x):
+        self.f_evals += 1
+        return self._call(x)
+
+    def gradient(self, x):
+        self.grad_evals += 1
+        if self._grad is not None:
+            return np.array(self._grad(*x), dtype=float)
+        grad = np.empty(len(x))
+        point = list(x)
+        for k, xk in enumerate(x):
+            h = self.fd_step * max(1.0, abs(xk))
+            point[k] = xk + h
+            upper = self._call(point)
+            point[k] = xk - h
+            lower = self._call(point)
+            point[k] = xk
+            grad[k] = (upper - lower) / (2 * h)
+        self.f_evals += 2 * len(x)
+        return grad
+
+
+@dataclass
+class OptimizeResult:
+    x: np.ndarray
+    fx: float
+    iterations: int
+    f_evals: int
+    grad_evals: int
+    converged: bool
+    message: str
+    elapsed: float = 0.0
+
+    @property
+    def iterations_per_sec(self):
+        return self.iterations / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        point = ", ".join(f"{v:.6f}" for v in self.x)
+        return (f"{self.message}: x = ({point}), f(x) = {self.fx:.6f} after {self.iterations} "
+                f"iterations, {self.f_evals} f evals, {self.grad_evals} gradient evals "
+                f"({self.iterations_per_sec:,.0f} iterations/sec)")
+
+
+def minimize(func, x0, method='gd', learning_rate=0.01, line_search=False, tol=1e-8,
+             max_iter=100_000, beta=0.9, beta2=0.999, eps=1e-8, max_abs=1e12):
+    """
+    Minimize func (an expression string, callable or Objective) from x0.
+    Stops when every gradient component is within tol, when a line search
+    can no longer make progress, or when x leaves [-max_abs, max_abs].
+    With line_search, learning_rate is only the first trial step.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)}")
+    objective = func if isinstance(func, Objective) else Objective(func)
+    x = np.atleast_1d(np.asarray(x0, dtype=float)).copy()
+    if objective.variables is not None and len(objective.variables) != len(x):
+        raise ValueError(f"x0 needs {len(objective.variables)} values "
+                         f"({', '.join(objective.variables)})")
+
+    start = time.perf_counter()
+    fx = objective.value(x)
+    velocity = np.zeros_like(x)
+    second = np.zeros_like(x)
+    step_size = learning_rate
+    converged, message = False, "iteration limit reached"
+    iteration = 0
+    for iteration in range(1, max_iter + 1):
+        grad = objective.gradient(x)
+        if np.max(np.abs(grad)) <= tol:
+            converged, message = True, "converged"
+            iteration -= 1
+            break
+        if method == 'gd':
+            direction = grad
+        elif method == 'momentum':
+            velocity = beta * velocity + grad
+            direction = velocity
+        else:
+            velocity = beta * velocity + (1 - beta) * grad
+            second = beta2 * second + (1 - beta2) * grad * grad
+            direction = ((velocity / (1 - beta ** iteration))
+                         / (np.sqrt(second / (1 - beta2 ** iteration)) + eps))
+
+        if line_search:
+            slope = float(grad @ direction)
+            if slope <= 0:
+                # Not a descent direction (stale momentum); fall back to the gradient
+                direction, slope = grad, float(grad @ grad)
+                velocity[:] = 0
+            # Start from twice the last accepted step so the step can grow again
+            step_size *= 2
+            while True:
+                candidate = x - step_size * direction
+                f_candidate = objective.value(candidate)
+                # Strict decrease as well: once f stops changing in floating point,
+                # accepting equal values would only wander around the minimum
+                if f_candidate <= fx - 1e-4 * step_size * slope and f_candidate < fx:
+                    break
+                step_size /= 2
+                if step_size * np.max(np.abs(direction)) <= 1e-16 * (1 + np.max(np.abs(x))):
+                    candidate = None
+                    break
+            if candidate is None:
+                converged, message = True, "converged (f cannot decrease further in floating point)"
+                break
+            x, fx = candidate, f_candidate
+        else:
+            x = x - step_size * direction
+            fx = objective.value(x)
+
+        if not (np.max(np.abs(x)) <= max_abs and math.isfinite(fx)):
+            message = "diverged"
+            break
+    return OptimizeResult(x, fx, iteration, objective.f_evals, objective.grad_evals,
+                          converged, message, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Minimize an expression by gradient descent")
+    parser.add_argument("expression", help="e.g. \"x**4 - 3*x**3 + 2\"")
+    parser.add_argument("--x0", type=float, nargs='+', required=True,
+                        help="starting point, one value per variable (alphabetical order)")
+    parser.add_argument("--method", choices=METHODS, default='gd')
+    parser.add_argument("--learning-rate", type=float, default=0.01)
+    parser.add_argument("--line-search", action='store_true')
+    parser.add_argument("--tol", type=float, default=1e-8)
+    parser.add_argument("--max-iter", type=int, default=100_000)
+    parser.add_argument("--compare", action='store_true',
+                        help="run every method with and without line search")
+    args = parser.parse_args()
+
+    try:
+        objective = Objective(args.expression)
+    except (SyntaxError, ValueError) as e:
+        print(f"Error: {e}")
+        return
+    kind = "symbolic" if objective.symbolic else "finite-difference"
+    print(f"Variables: {', '.join(objective.variables)}; {kind} gradient")
+
+    runs = ([(m, ls) for m in METHODS for ls in (False, True)] if args.compare
+            else [(args.method, args.line_search)])
+    for method, line_search in runs:
+        try:
+            result = minimize(Objective(args.expression), args.x0, method, args.learning_rate,
+                              line_search, args.tol, args.max_iter)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        label = method + (" + line search" if line_search else "")
+        print(f"{label:>22}: {result.summary()}")
+
+
+if __name__ == "__main__":
+    main()
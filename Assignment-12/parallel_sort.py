@@ -0,0 +1,146 @@
+"""
+Parallel sample sort for large in-memory NumPy arrays.
+
+The array is copied once into a multiprocessing.shared_memory block and
+workers only ever receive the block names and index ranges, so none of
+the data is pickled:
+
+1. Sample the array and pick splitters that cut it into buckets of about
+   equal size.
+2. Each worker sorts one contiguous chunk of the input in place and returns
+   where the splitters fall in it (a few integers per chunk).
+3. From those counts the parent knows every bucket's final offset. Each
+   worker copies its bucket's pieces from all chunks straight into their
+   final slot of the output block and sorts them there; the buckets are
+   already in order, so no concatenation step is needed.
+
+Arrays smaller than PARALLEL_MIN_SIZE, or a single worker, are sorted in
+this process with np.sort.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+PARALLEL_MIN_SIZE = 1 << 20
+OVERSAMPLE = 64  # samples per bucket; more gives evener buckets
+BUCKETS_PER_WORKER = 4  # extra buckets even out skew across the pool
+
+
+def _attach(name, dtype, n):
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray((n,), dtype=dtype, buffer=block.buf)
+
+
+def _sort_chunk(name, dtype, n, lo, hi, splitters):
+    """Sort src[lo:hi] in place and return where each splitter falls in it."""
+    block, src = _attach(name, dtype, n)
+    chunk = src[lo:hi]
+    # NumPy's (SIMD) sort is cheaper than bucketing each element by binary search
+    chunk.sort()
+    cut = np.searchsorted(chunk, splitters, side='right')
+    # Views into the block must be gone before it can be closed
+    del src, chunk
+    block.close()
+    return cut
+
+
+def _sort_bucket(src_name, dst_name, dtype, n, offset, pieces):
+    """Gather one bucket's sorted pieces into dst[offset:] and sort them there."""
+    src_block, src = _attach(src_name, dtype, n)
+    dst_block, dst = _attach(dst_name, dtype, n)
+    end = offset
+    for lo, hi in pieces:
+        dst[end:end + hi - lo] = src[lo:hi]
+        end += hi - lo
+    bucket = dst[offset:end]
+    bucket.sort()
+    del src, dst, bucket
+    src_block.close()
+    dst_block.close()
+
+
+def _splitters(array, buckets, rng):
+    sample = np.sort(array[rng.integers(0, len(array), buckets * OVERSAMPLE)])
+    return sample[OVERSAMPLE::OVERSAMPLE][:buckets - 1]
+
+
+def make_pool(workers=None):
+    """
+    Start a worker pool for parallel_sort. The shared-memory resource tracker
+    is started first so the workers share it; a worker with a tracker of its
+    own would report the blocks it attached to as leaked when it exits.
+    """
+    resource_tracker.ensure_running()
+    return ProcessPoolExecutor(workers)
+
+
+def parallel_sort(array, workers=None, executor=None, seed=0):
+    """
+    Return a sorted copy of a 1-D numeric NumPy array, sorted by `workers`
+    processes (default: all CPUs). A pool from make_pool() can be passed to
+    avoid starting a new one on every call.
+    """
+    array = np.asarray(array)
+    if array.ndim != 1 or not (np.issubdtype(array.dtype, np.integer)
+                               or np.issubdtype(array.dtype, np.floating)):
+        raise TypeError("parallel_sort() requires a 1-D numeric array")
+    workers = workers or getattr(executor, '_max_workers', None) or os.cpu_count()
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    n = len(array)
+    if workers == 1 or n < PARALLEL_MIN_SIZE:
+        # Equal numbers are indistinguishable, so the faster unstable sort is fine
+        return np.sort(array)
+
+    dtype = array.dtype
+    src_block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    dst_block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    own_executor = executor is None
+    if own_executor:
+        executor = make_pool(workers)
+    try:
+        src = np.ndarray((n,), dtype=dtype, buffer=src_block.buf)
+        dst = np.ndarray((n,), dtype=dtype, buffer=dst_block.buf)
+        src[:] = array
+        buckets = workers * BUCKETS_PER_WORKER
+        splitters = _splitters(array, buckets, np.random.default_rng(seed))
+
+        bounds = np.linspace(0, n, workers + 1).astype(np.int64)
+        chunks = list(zip(bounds[:-1], bounds[1:]))
+        cuts = list(executor.map(_sort_chunk, [src_block.name] * workers, [dtype] * workers,
+                                 [n] * workers, *zip(*chunks), [splitters] * workers))
+        # edges[c, b]..edges[c, b + 1] is bucket b's piece of chunk c (absolute indices)
+        edges = np.array([np.concatenate(([lo], lo + cut, [hi]))
+                          for (lo, hi), cut in zip(chunks, cuts)])
+        sizes = (edges[:, 1:] - edges[:, :-1]).sum(axis=0)
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+        # Largest buckets first so a skewed bucket does not finish last
+        order = np.argsort(-sizes, kind='stable')
+        futures = [executor.submit(_sort_bucket, src_block.name, dst_block.name, dtype, n,
+                                   int(offsets[b]),
+                                   [(int(edges[c, b]), int(edges[c, b + 1]))
+                                    for c in range(workers) if edges[c, b] < edges[c, b + 1]])
+                   for b in order if sizes[b]]
+        for future in futures:
+            future.result()
+        return dst.copy()
+    finally:
+        if own_executor:
+            executor.shutdown()
+        src = dst = None
+        for block in (src_block, dst_block):
+            block.close()
+            block.unlink()
+
+
+# Main program
+if __name__ == "__main__":
+    try:
+        user_input = input("Enter numbers separated by spaces: ")
+        numbers = np.array(list(map(int, user_input.strip().split())), dtype=np.int64)
+        print("Sorted list:", parallel_sort(numbers).tolist())
+    except ValueError:
+        print("Please enter valid integers separated by spaces.")
@@ -0,0 +1,204 @@
+"""
+Data-driven production-planning model: the Task-3.py chocolate model for
+any number of products and resources.
+
+Input CSV files:
+
+    products.csv    product, profit[, lower, upper, integer]
+    usage.csv       product, resource, amount     (one row per nonzero)
+    capacities.csv  resource, capacity
+
+`upper` may be empty for no upper bound; `integer` is Y/N (default Y, as in
+Task-3.py). Repeated (product, resource) rows are added together.
+
+The model is built in bulk: the sparse usage data is grouped by resource
+with NumPy, and each constraint and the objective are created directly from
+(variable, coefficient) pairs, instead of summing one Python expression per
+term as `x + y <= 5` does.
+
+Usage:
+    python production_model.py products.csv usage.csv capacities.csv -o plan.csv
+"""
+import argparse
+import csv
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+from pulp import (PULP_CBC_CMD, LpAffineExpression, LpConstraint, LpConstraintLE, LpMaximize,
+                  LpProblem, LpStatus, LpVariable)
+
+
+@dataclass
+class PlanData:
+    """Products, resources and the sparse usage matrix of a production plan."""
+    products: list
+    profit: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray  # inf = no upper bound
+    integer: np.ndarray  # bool per product
+    resources: list
+    capacity: np.ndarray
+    # Usage matrix in coordinate form: amount of resource usage_resource[k]
+    # used by one unit of product usage_product[k]
+    usage_product: np.ndarray
+    usage_resource: np.ndarray
+    usage_amount: np.ndarray
+
+
+@dataclass
+class ModelTimings:
+    build: float = 0.0
+    solve: float = 0.0
+
+    def summary(self):
+        return f"build {self.build:.3f}s, solve {self.solve:.3f}s"
+
+
+def chocolate_plan():
+    """The two-product model from Task-3.py as PlanData."""
+    return plan_from_rows(
+        [('Chocolate_A', 6), ('Chocolate_B', 5)],
+        [('Chocolate_A', 'Milk', 1), ('Chocolate_B', 'Milk', 1),
+         ('Chocolate_A', 'Choco', 3), ('Chocolate_B', 'Choco', 2)],
+        [('Milk', 5), ('Choco', 12)])
+
+
+def plan_from_rows(products, usage, capacities):
+    """
+    Build PlanData from plain rows: products as (name, profit[, lower, upper,
+    integer]), usage as (product, resource, amount), capacities as
+    (resource, capacity).
+    """
+    names, profit, lower, upper, integer = [], [], [], [], []
+    for row in products:
+        name, p, lo, up, is_int = (tuple(row) + (0, None, True))[:5]
+        names.append(name)
+        profit.append(float(p))
+        lower.append(float(lo or 0))
+        upper.append(np.inf if up in (None, '') else float(up))
+        integer.append(bool(is_int))
+    resources = [resource for resource, _ in capacities]
+    product_index = {name: i for i, name in enumerate(names)}
+    resource_index = {resource: i for i, resource in enumerate(resources)}
+    if len(product_index) != len(names):
+        raise ValueError("duplicate product names")
+    if len(resource_index) != len(resources):
+        raise ValueError("duplicate resource names")
+
+    rows = []
+    for product, resource, amount in usage:
+        if product not in product_index:
+            raise ValueError(f"usage refers to unknown product {product!r}")
+        if resource not in resource_index:
+            raise ValueError(f"usage refers to resource {resource!r} with no capacity")
+        rows.append((product_index[product], resource_index[resource], float(amount)))
+    usage_array = np.array(rows, dtype=float).reshape(-1, 3)
+    return PlanData(names, np.array(profit), np.array(lower), np.array(upper),
+                    np.array(integer, dtype=bool), resources,
+                    np.array([float(c) for _, c in capacities]),
+                    usage_array[:, 0].astype(np.int64), usage_array[:, 1].astype(np.int64),
+                    usage_array[:, 2])
+
+
+def _read_rows(path, columns, optional=()):
+    with open(path, newline='') as file:
+        reader = csv.DictReader(file)
+        missing = set(columns) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {', '.join(sorted(missing))}")
+        for row in reader:
+            yield tuple(row[c] for c in columns) + tuple(row.get(c) for c in optional)
+
+
+def read_plan(products_path, usage_path, capacities_path):
+    """Read PlanData from the three CSV files."""
+    products = [(name, profit, lower, upper,
+                 (flag or 'Y').strip().upper() not in ('N', 'NO', 'FALSE', '0'))
+                for name, profit, lower, upper, flag in
+                _read_rows(products_path, ('product', 'profit'), ('lower', 'upper', 'integer'))]
+    usage = _read_rows(usage_path, ('product', 'resource', 'amount'))
+    capacities = list(_read_rows(capacities_path, ('resource', 'capacity')))
+    return plan_from_rows(products, usage, capacities)
+
+
+def build_model(plan, name="Production_Plan"):
+    """Return (model, variables) for a PlanData, built from the sparse usage data in bulk."""
+    variables = [LpVariable(product, lowBound=lo, upBound=None if np.isinf(up) else up,
+                            cat='Integer' if is_int else 'Continuous')
+                 for product, lo, up, is_int in zip(plan.products, plan.lower.tolist(),
+                                                    plan.upper.tolist(), plan.integer.tolist())]
+    model = LpProblem(name, LpMaximize)
+    model.setObjective(LpAffineExpression(
+        (variables[i], c) for i, c in enumerate(plan.profit.tolist()) if c))
+
+    # Sum repeated (resource, product) entries, then group the nonzeros by resource
+    n_products = len(plan.products)
+    keys, inverse = np.unique(plan.usage_resource * n_products + plan.usage_product,
+                              return_inverse=True)
+    amounts = np.bincount(inverse.ravel(), weights=plan.usage_amount, minlength=len(keys))
+    resource_of = keys // n_products
+    product_of = (keys % n_products).tolist()
+    bounds = np.searchsorted(resource_of, np.arange(len(plan.resources) + 1)).tolist()
+    amounts = amounts.tolist()
+    for r, resource in enumerate(plan.resources):
+        lo, hi = bounds[r], bounds[r + 1]
+        expr = LpAffineExpression((variables[product_of[k]], amounts[k]) for k in range(lo, hi))
+        model.addConstraint(LpConstraint(expr, LpConstraintLE, f"cap_{resource}",
+                                         float(plan.capacity[r])))
+    return model, variables
+
+
+def solve_plan(plan, solver=None):
+    """Build and solve a plan. Returns (model, variables, ModelTimings)."""
+    timings = ModelTimings()
+    start = time.perf_counter()
+    model, variables = build_model(plan)
+    timings.build = time.perf_counter() - start
+    start = time.perf_counter()
+    model.solve(solver or PULP_CBC_CMD(msg=False))
+    timings.solve = time.perf_counter() - start
+    return model, variables, timings
+
+
+def write_plan(path, variables):
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['product', 'quantity'])
+        for var in variables:
+            writer.writerow([var.name, var.value()])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve a production plan from CSV data")
+    parser.add_argument("products", help="CSV: product, profit[, lower, upper, integer]")
+    parser.add_argument("usage", help="CSV: product, resource, amount")
+    parser.add_argument("capacities", help="CSV: resource, capacity")
+    parser.add_argument("-o", "--output", help="write product quantities to this CSV")
+    parser.add_argument("--time-limit", type=float, default=None, help="solver time limit (s)")
+    parser.add_argument("--msg", action='store_true', help="show solver output")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        plan = read_plan(args.products, args.usage, args.capacities)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    read_time = time.perf_counter() - start
+    print(f"Read {len(plan.products)} products, {len(plan.resources)} resources, "
+          f"{len(plan.usage_amount)} usage entries in {read_time:.3f}s")
+
+    model, variables, timings = solve_plan(
+        plan, PULP_CBC_CMD(msg=args.msg, timeLimit=args.time_limit))
+    print(f"Status: {LpStatus[model.status]}; {timings.summary()}")
+    if model.objective is not None and model.objective.value() is not None:
+        print(f"Maximum Profit: Rs {model.objective.value():,.2f}")
+    if args.output:
+        write_plan(args.output, variables)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+What-if scenario sweeps over a production plan (the Task-3.py chocolate
+model by default).
+
+A scenario overrides some capacities and profits of the base plan:
+
+    capacity:Milk=6  capacity:Choco=10  profit:Chocolate_A=7
+
+Scenarios come from a CSV file (a `scenario` name column plus one column
+per parameter; empty cells keep the base value) or from a --grid of
+parameter values, whose cartesian product is swept.
+
+Every worker process builds the base model once, then for each scenario
+only rewrites the changed constraint right-hand sides and objective
+coefficients before solving. Scenarios with identical parameters are
+identified by a hash of their overrides and solved only once.
+
+Usage:
+    python scenario_sweep.py --grid capacity:Milk=4,5,6 capacity:Choco=10,12,14 -o results.csv
+    python scenario_sweep.py scenarios.csv --plan products.csv usage.csv capacities.csv
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+from pulp import PULP_CBC_CMD, LpStatus
+
+from production_model import build_model, chocolate_plan, read_plan
+
+KINDS = ('capacity', 'profit')
+QUANTITY_COLUMNS_LIMIT = 20  # list each product's quantity for plans up to this size
+
+
+def parse_param(name):
+    """Split 'capacity:Milk' into ('capacity', 'Milk')."""
+    kind, sep, target = name.partition(':')
+    if not sep or kind not in KINDS or not target:
+        raise ValueError(f"bad parameter {name!r}; expected capacity:<resource> "
+                         f"or profit:<product>")
+    return kind, target
+
+
+def scenario_hash(overrides):
+    """Stable hash of a scenario's overrides, independent of their order."""
+    canonical = json.dumps(sorted(overrides.items()), separators=(',', ':'))
+    return hashlib.sha1(canonical.encode()).hexdigest()[:16]
+
+
+def read_scenarios(path):
+    """Yield (name, overrides) from a scenarios CSV."""
+    with open(path, newline='') as file:
+        reader = csv.DictReader(file)
+        params = [c for c in reader.fieldnames or () if c != 'scenario']
+        for c in params:
+            parse_param(c)
+        for i, row in enumerate(reader, 1):
+            try:
+                overrides = {c: float(row[c]) for c in params if row[c] not in (None, '')}
+            except ValueError as e:
+                raise ValueError(f"{path}, row {i}: {e}")
+            yield row.get('scenario') or f"scenario_{i}", overrides
+
+
+def grid_scenarios(specs):
+    """Yield (name, overrides) for the cartesian product of 'param=v1,v2,...' specs."""
+    params, values = [], []
+    for spec in specs:
+        name, sep, listed = spec.partition('=')
+        if not sep:
+            raise ValueError(f"bad grid entry {spec!r}; expected param=v1,v2,...")
+        parse_param(name)
+        params.append(name)
+        values.append([float(v) for v in listed.split(',')])
+    for i, combo in enumerate(product(*values), 1):
+        yield f"scenario_{i}", dict(zip(params, combo))
+
+
+class ScenarioModel:
+    """The base model built once, with in-place overrides for each scenario."""
+
+    def __init__(self, plan):
+        self.model, self.variables = build_model(plan)
+        self.by_product = {var.name: var for var in self.variables}
+        self.constraints = {resource: self.model.constraints[f"cap_{resource}"]
+                            for resource in plan.resources}
+        self.base_rhs = {r: -c.constant for r, c in self.constraints.items()}
+        self.base_profit = dict(self.model.objective.items())
+
+    def solve(self, overrides, solver):
+        """Solve with overrides applied, then restore the base model."""
+        changed = []
+        try:
+            for name, value in overrides.items():
+                kind, target = parse_param(name)
+                if kind == 'capacity':
+                    self.constraints[target].constant = -value
+                else:
+                    self.model.objective[self.by_product[target]] = value
+                changed.append((kind, target))
+            start = time.perf_counter()
+            self.model.solve(solver)
+            elapsed = time.perf_counter() - start
+            return (LpStatus[self.model.status], self.model.objective.value(),
+                    [var.value() for var in self.variables], elapsed)
+        finally:
+            for kind, target in changed:
+                if kind == 'capacity':
+                    self.constraints[target].constant = -self.base_rhs[target]
+                else:
+                    var = self.by_product[target]
+                    if var in self.base_profit:
+                        self.model.objective[var] = self.base_profit[var]
+                    else:
+                        del self.model.objective[var]
+
+
+_worker_model = None
+
+
+def _init_worker(plan):
+    global _worker_model
+    _worker_model = ScenarioModel(plan)
+
+
+def _solve_scenario(job):
+    key, overrides = job
+    try:
+        return key, _worker_model.solve(overrides, PULP_CBC_CMD(msg=False))
+    except KeyError as e:
+        return key, (f"Error: unknown name {e}", None, None, 0.0)
+
+
+def run_sweep(plan, scenarios, workers=None):
+    """
+    Solve every (name, overrides) scenario. Returns result rows in input
+    order: name, hash, status, objective, quantities, solve seconds and
+    whether the result was reused from an identical earlier scenario.
+    """
+    scenarios = list(scenarios)
+    unique = {}
+    for _, overrides in scenarios:
+        unique.setdefault(scenario_hash(overrides), overrides)
+
+    workers = min(workers or os.cpu_count(), len(unique)) or 1
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(plan,)) as pool:
+        chunksize = max(1, len(unique) // (workers * 8))
+        solved = dict(pool.map(_solve_scenario, unique.items(), chunksize=chunksize))
+
+    rows, seen = [], set()
+    for name, overrides in scenarios:
+        key = scenario_hash(overrides)
+        status, objective, quantities, seconds = solved[key]
+        rows.append({'scenario': name, 'hash': key, 'status': status, 'objective': objective,
+                     'quantities': quantities, 'solve_seconds': seconds,
+                     'cached': key in seen})
+        seen.add(key)
+    return rows
+
+
+def write_results(path, rows, params, products):
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['scenario', 'hash'] + params + ['status', 'objective']
+                        + products + ['solve_seconds', 'cached'])
+        for row, overrides in rows:
+            quantities = row['quantities'] or [None] * len(products)
+            writer.writerow([row['scenario'], row['hash']]
+                            + [overrides.get(p, '') for p in params]
+                            + [row['status'], row['objective']]
+                            + quantities[:len(products)]
+                            + [f"{row['solve_seconds']:.4f}", 'Y' if row['cached'] else 'N'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="What-if scenario sweep for a production plan")
+    parser.add_argument("scenarios", nargs='?', help="scenarios CSV (or use --grid)")
+    parser.add_argument("--grid", nargs='+', metavar="PARAM=V1,V2",
+                        help="sweep the cartesian product of these parameter values")
+    parser.add_argument("--plan", nargs=3, metavar=("PRODUCTS", "USAGE", "CAPACITIES"),
+                        help="base plan CSVs (default: the Task-3.py chocolate model)")
+    parser.add_argument("-o", "--output", default="scenario_results.csv")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    if bool(args.scenarios) == bool(args.grid):
+        parser.error("give either a scenarios CSV or --grid")
+
+    try:
+        plan = read_plan(*args.plan) if args.plan else chocolate_plan()
+        scenarios = list(read_scenarios(args.scenarios) if args.scenarios
+                         else grid_scenarios(args.grid))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if not scenarios:
+        print("No scenarios to run.")
+        return
+
+    start = time.perf_counter()
+    rows = run_sweep(plan, scenarios, args.workers)
+    elapsed = time.perf_counter() - start
+
+    params = sorted({p for _, overrides in scenarios for p in overrides})
+    products = plan.products if len(plan.products) <= QUANTITY_COLUMNS_LIMIT else []
+    write_results(args.output, zip(rows, (o for _, o in scenarios)), params, products)
+    solved = sum(not row['cached'] for row in rows)
+    solve_total = sum(row['solve_seconds'] for row in rows if not row['cached'])
+    print(f"{len(rows)} scenarios ({solved} solved, {len(rows) - solved} cached) in "
+          f"{elapsed:.2f}s; {solve_total:.2f}s total solve time. Results in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Reusable search index with the same answers as linear_search in Task-1.py.
+
+Build the index once over a sequence, then answer many lookups:
+
+- hash path: a dict from value to its first index, O(1) per lookup;
+- sorted path: values sorted with their indices, for bisect-based
+  range queries, built on first use;
+- NumPy path: for numeric arrays, a stable argsort plus np.searchsorted,
+  so a whole batch of targets is answered in one vectorized call.
+
+Every lookup returns the index of the first element equal to the target,
+or -1, exactly like linear_search.
+"""
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+
+def _is_numeric_array(seq):
+    return isinstance(seq, np.ndarray) and seq.ndim == 1 and (
+        np.issubdtype(seq.dtype, np.integer) or np.issubdtype(seq.dtype, np.floating))
+
+
+class SearchIndex:
+    def __init__(self, seq, mode='auto'):
+        """
+        mode is 'auto' (NumPy for 1-D numeric arrays, hash otherwise),
+        'hash' or 'numpy'.
+        """
+        if mode not in ('auto', 'hash', 'numpy'):
+            raise ValueError("mode must be 'auto', 'hash' or 'numpy'")
+        if mode == 'auto':
+            mode = 'numpy' if _is_numeric_array(seq) else 'hash'
+        self.mode = mode
+        self._seq = seq
+        self._first = None
+        self._sorted_values = None
+        self._sorted_positions = None
+
+        if mode == 'numpy':
+            values = np.asarray(seq)
+            if not (np.issubdtype(values.dtype, np.integer) or np.issubdtype(values.dtype, np.floating)):
+                raise TypeError("the NumPy path needs a numeric sequence")
+            # Stable sort keeps equal values in index order, so the leftmost match is the first one
+            self._order = np.argsort(values, kind='stable')
+            self._np_sorted = values[self._order]
+        else:
+            self._first = self._build_hash(seq)
+
+    @staticmethod
+    def _build_hash(seq):
+        first = {}
+        for index, value in enumerate(seq):
+            # NaN never equals itself, so linear_search can never find it
+            if value != value:
+                continue
+            try:
+                first.setdefault(value, index)
+            except TypeError:
+                raise TypeError("the hash path needs hashable elements; use mode='numpy' "
+                                "for numeric arrays")
+        return first
+
+    def __len__(self):
+        return len(self._seq)
+
+    def search(self, target):
+        """Return the index of the first element equal to target, else -1."""
+        if self.mode == 'numpy':
+            return int(self.search_many([target])[0])
+        try:
+            return self._first.get(target, -1)
+        except TypeError:
+            return -1  # unhashable targets cannot equal any hashable element
+
+    def search_many(self, targets):
+        """
+        Look up many targets at once. Returns a NumPy int array on the NumPy
+        path and a list of ints otherwise.
+        """
+        if self.mode == 'numpy':
+            targets = np.asarray(targets)
+            if targets.dtype == object or not (np.issubdtype(targets.dtype, np.number)
+                                               or targets.dtype == bool):
+                return np.array([self._search_scalar(t) for t in targets.tolist()], dtype=np.int64)
+            if not len(self._np_sorted):
+                return np.full(targets.shape, -1, dtype=np.int64)
+            pos = np.searchsorted(self._np_sorted, targets, side='left')
+            clipped = np.minimum(pos, len(self._np_sorted) - 1)
+            found = (pos < len(self._np_sorted)) & (self._np_sorted[clipped] == targets)
+            return np.where(found, self._order[clipped], -1).astype(np.int64)
+        get = self._first.get
+        result = []
+        for target in targets:
+            try:
+                result.append(get(target, -1))
+            except TypeError:
+                result.append(-1)
+        return result
+
+    def _search_scalar(self, target):
+        if self._first is None:
+            self._first = self._build_hash(np.asarray(self._seq).tolist())
+        try:
+            return self._first.get(target, -1)
+        except TypeError:
+            return -1
+
+    def _ensure_sorted(self):
+        if self._sorted_values is None:
+            if self.mode == 'numpy':
+                self._sorted_values = self._np_sorted
+                self._sorted_positions = self._order
+            else:
+                pairs = sorted((value, index) for index, value in enumerate(self._seq)
+                               if value == value)
+                self._sorted_values = [value for value, _ in pairs]
+                self._sorted_positions = [index for _, index in pairs]
+
+    def range_indices(self, lo, hi):
+        """Return the indices of all elements with lo <= value <= hi, in original order."""
+        self._ensure_sorted()
+        if self.mode == 'numpy':
+            left = np.searchsorted(self._sorted_values, lo, side='left')
+            right = np.searchsorted(self._sorted_values, hi, side='right')
+            return np.sort(self._sorted_positions[left:right])
+        left = bisect_left(self._sorted_values, lo)
+        right = bisect_right(self._sorted_values, hi)
+        return sorted(self._sorted_positions[left:right])
+
+    def count_range(self, lo, hi):
+        """Return how many elements have lo <= value <= hi."""
+        self._ensure_sorted()
+        if self.mode == 'numpy':
+            return int(np.searchsorted(self._sorted_values, hi, side='right')
+                       - np.searchsorted(self._sorted_values, lo, side='left'))
+        return bisect_right(self._sorted_values, hi) - bisect_left(self._sorted_values, lo)
+
+
+# Main program
+if __name__ == "__main__":
+    try:
+        user_input = input("Enter list elements separated by spaces: ")
+        index = SearchIndex(user_input.split())
+
+        targets = input("Enter the values to search for, separated by spaces: ").split()
+        for target, position in zip(targets, index.search_many(targets)):
+            if position != -1:
+                print(f"Value '{target}' found at index {position}.")
+            else:
+                print(f"Value '{target}' not found in the list.")
+    except Exception as e:
+        print(f"An error occurred: {e}")
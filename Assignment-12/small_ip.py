@@ -0,0 +1,265 @@
+"""
+In-process solver for small integer programs such as the Task-3.py model.
+
+model.solve() with PuLP's default CBC writes the model to a temp file,
+starts a CBC process and reads the solution back; for a two-variable model
+that overhead is nearly all of the solve time. solve_small() instead
+solves small models right here, with a dense two-phase simplex for the LP
+relaxations and best-first branch and bound (a heap ordered on the LP
+bound) for the integer variables.
+Models above SMALL_MODEL_SIZE (variables x constraints), or whose branch
+and bound exceeds MAX_NODES, are handed to CBC as before.
+
+Usage (in place of model.solve()):
+    from small_ip import solve_small
+    path = solve_small(model)   # 'in-process' or 'cbc'
+"""
+import heapq
+import math
+
+import numpy as np
+from pulp import (PULP_CBC_CMD, LpConstraintEQ, LpConstraintGE, LpMinimize, LpSolutionInfeasible,
+                  LpSolutionOptimal, LpSolutionUnbounded, LpStatusInfeasible, LpStatusOptimal,
+                  LpStatusUnbounded)
+
+SMALL_MODEL_SIZE = 40  # variables x constraints; CBC wins above this (bench_small_ip.py)
+MAX_NODES = 2_000
+EPS = 1e-9
+INT_TOL = 1e-6
+
+OPTIMAL, INFEASIBLE, UNBOUNDED = 'Optimal', 'Infeasible', 'Unbounded'
+
+
+class NodeLimitReached(Exception):
+    pass
+
+
+def _pivot(tableau, basis, row, col):
+    tableau[row] /= tableau[row, col]
+    column = tableau[:, col].copy()
+    column[row] = 0.0
+    tableau -= np.outer(column, tableau[row])
+    basis[row] = col
+
+
+def _run_simplex(tableau, basis, columns):
+    """
+    Maximize the objective row (last row holds reduced costs, negated) over
+    the allowed columns. Bland's rule (lowest index) cannot cycle.
+    Returns False if the objective is unbounded.
+    """
+    while True:
+        costs = tableau[-1, :columns]
+        entering = np.flatnonzero(costs < -EPS)
+        if not len(entering):
+            return True
+        col = entering[0]
+        column = tableau[:-1, col]
+        positive = np.flatnonzero(column > EPS)
+        if not len(positive):
+            return False
+        ratios = tableau[:-1, -1][positive] / column[positive]
+        best = positive[ratios <= ratios.min() + EPS]
+        row = best[np.argmin(np.asarray(basis)[best])]
+        _pivot(tableau, basis, row, col)
+
+
+def simplex(c, A_ub, b_ub, A_eq, b_eq):
+    """
+    Maximize c @ x subject to A_ub @ x <= b_ub, A_eq @ x == b_eq, x >= 0
+    with a dense two-phase tableau. Returns (status, x, objective).
+    """
+    n = len(c)
+    A = np.vstack([A_ub, A_eq]) if len(A_eq) else np.asarray(A_ub, dtype=float)
+    b = np.concatenate([b_ub, b_eq]) if len(b_eq) else np.asarray(b_ub, dtype=float)
+    m = len(b)
+    n_ub = len(b_ub)
+    # Columns: x, one slack per <= row, one artificial per row that needs it
+    sign = np.where(b < 0, -1.0, 1.0)
+    needs_artificial = [i >= n_ub or b[i] < 0 for i in range(m)]
+    artificials = [i for i in range(m) if needs_artificial[i]]
+    width = n + n_ub + len(artificials)
+    tableau = np.zeros((m + 1, width + 1))
+    tableau[:m, :n] = A * sign[:, None]
+    tableau[:m, -1] = b * sign
+    basis = [0] * m
+    for i in range(n_ub):
+        tableau[i, n + i] = sign[i]
+        if not needs_artificial[i]:
+            basis[i] = n + i
+    for k, i in enumerate(artificials):
+        tableau[i, n + n_ub + k] = 1.0
+        basis[i] = n + n_ub + k
+
+    if artificials:
+        # Phase 1: maximize minus the sum of the artificials
+        tableau[-1, n + n_ub:width] = 1.0
+        for i in artificials:
+            tableau[-1] -= tableau[i]
+        _run_simplex(tableau, basis, width)
+        if tableau[-1, -1] < -EPS * max(1.0, np.abs(b).max()):
+            return INFEASIBLE, None, None
+        # Drive artificials still basic (at zero) out of the basis
+        for i in range(m):
+            if basis[i] >= n + n_ub:
+                candidates = np.flatnonzero(np.abs(tableau[i, :n + n_ub]) > EPS)
+                if len(candidates):
+                    _pivot(tableau, basis, i, candidates[0])
+        tableau[:, n + n_ub:width] = 0.0
+
+    tableau[-1] = 0.0
+    tableau[-1, :n] = -np.asarray(c, dtype=float)
+    for i in range(m):
+        if basis[i] < n + n_ub and tableau[-1, basis[i]]:
+            tableau[-1] -= tableau[-1, basis[i]] * tableau[i]
+    if not _run_simplex(tableau, basis, n + n_ub):
+        return UNBOUNDED, None, None
+    x = np.zeros(width)
+    for i in range(m):
+        x[basis[i]] = tableau[i, -1]
+    return OPTIMAL, x[:n], float(tableau[-1, -1])
+
+
+def solve_lp(c, A_ub, b_ub, A_eq, b_eq, lower, upper):
+    """simplex() with variable bounds lower <= x <= upper (upper may be inf)."""
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("solve_lp() needs finite lower bounds")
+    # Shift x = lower + y so y >= 0, and add finite upper bounds as rows
+    A_ub = np.asarray(A_ub, dtype=float).reshape(-1, len(c))
+    A_eq = np.asarray(A_eq, dtype=float).reshape(-1, len(c))
+    b_ub = np.asarray(b_ub, dtype=float) - A_ub @ lower
+    b_eq = np.asarray(b_eq, dtype=float) - A_eq @ lower
+    bounded = np.flatnonzero(np.isfinite(upper))
+    if len(bounded):
+        A_ub = np.vstack([A_ub, np.eye(len(c))[bounded]])
+        b_ub = np.concatenate([b_ub, (upper - lower)[bounded]])
+    status, y, objective = simplex(c, A_ub, b_ub, A_eq, b_eq)
+    if status != OPTIMAL:
+        return status, None, None
+    return status, lower + y, objective + float(np.dot(c, lower))
+
+
+def _rounded_incumbent(x, integer, c, A_ub, b_ub, A_eq, b_eq, lower, upper):
+    """Round the integer variables of an LP solution down; return it if still feasible."""
+    candidate = np.where(integer, np.floor(x + INT_TOL), x)
+    candidate = np.clip(candidate, lower, upper)
+    scale = 1e-9 * (1 + np.abs(candidate).sum())
+    if len(b_ub) and np.any(A_ub @ candidate > np.asarray(b_ub) + scale):
+        return None
+    if len(b_eq) and np.any(np.abs(A_eq @ candidate - np.asarray(b_eq)) > scale):
+        return None
+    return candidate
+
+
+def branch_and_bound(c, A_ub, b_ub, A_eq, b_eq, lower, upper, integer, max_nodes=MAX_NODES):
+    """
+    Maximize c @ x over the constraints with integer[j] variables integral.
+    Best-first on the LP bound, branching on the most fractional variable;
+    rounding every LP solution down gives early incumbents (for production
+    plans with <= constraints it is always feasible). Returns
+    (status, x, objective); raises NodeLimitReached after max_nodes LPs.
+    """
+    c = np.asarray(c, dtype=float)
+    A_ub = np.asarray(A_ub, dtype=float).reshape(-1, len(c))
+    A_eq = np.asarray(A_eq, dtype=float).reshape(-1, len(c))
+    integer = np.asarray(integer, dtype=bool)
+    best_x, best = None, -math.inf
+    unbounded = False
+    heap = []
+    nodes = 0
+
+    def visit(lo, up):
+        nonlocal best_x, best, unbounded, nodes
+        nodes += 1
+        if nodes > max_nodes:
+            raise NodeLimitReached
+        status, x, objective = solve_lp(c, A_ub, b_ub, A_eq, b_eq, lo, up)
+        if status == UNBOUNDED:
+            unbounded = True
+            return
+        if status != OPTIMAL or objective <= best + 1e-9 * max(1.0, abs(best)):
+            return
+        fraction = np.abs(x - np.round(x))
+        fraction[~integer] = 0.0
+        j = int(np.argmax(fraction))
+        if fraction[j] <= INT_TOL:
+            best_x, best = np.where(integer, np.round(x), x), objective
+            return
+        rounded = _rounded_incumbent(x, integer, c, A_ub, b_ub, A_eq, b_eq, lo, up)
+        if rounded is not None and c @ rounded > best:
+            best_x, best = rounded, float(c @ rounded)
+        heapq.heappush(heap, (-objective, nodes, lo, up, j, x[j]))
+
+    visit(np.asarray(lower, dtype=float), np.asarray(upper, dtype=float))
+    while heap:
+        bound, _, lo, up, j, xj = heapq.heappop(heap)
+        if -bound <= best + 1e-9 * max(1.0, abs(best)):
+            break  # every open node is bounded by this one
+        floor_up, ceil_lo = up.copy(), lo.copy()
+        floor_up[j] = math.floor(xj)
+        ceil_lo[j] = math.ceil(xj)
+        visit(lo, floor_up)
+        visit(ceil_lo, up)
+    if best_x is not None:
+        return OPTIMAL, best_x, best
+    return (UNBOUNDED if unbounded else INFEASIBLE), None, None
+
+
+def model_arrays(model):
+    """Dense arrays for a PuLP model, in maximization form."""
+    variables = model.variables()
+    index = {var.name: j for j, var in enumerate(variables)}
+    n = len(variables)
+    flip = -1.0 if model.sense == LpMinimize else 1.0
+    c = np.zeros(n)
+    for var, coef in (model.objective or {}).items():
+        c[index[var.name]] = flip * coef
+    A_ub, b_ub, A_eq, b_eq = [], [], [], []
+    for constraint in model.constraints.values():
+        row = np.zeros(n)
+        for var, coef in constraint.items():
+            row[index[var.name]] = coef
+        rhs = -constraint.constant
+        if constraint.sense == LpConstraintEQ:
+            A_eq.append(row)
+            b_eq.append(rhs)
+        elif constraint.sense == LpConstraintGE:
+            A_ub.append(-row)
+            b_ub.append(-rhs)
+        else:
+            A_ub.append(row)
+            b_ub.append(rhs)
+    lower = np.array([-math.inf if v.lowBound is None else v.lowBound for v in variables],
+                     dtype=float)
+    upper = np.array([math.inf if v.upBound is None else v.upBound for v in variables],
+                     dtype=float)
+    integer = np.array([v.cat == 'Integer' for v in variables])
+    return variables, c, A_ub, b_ub, A_eq, b_eq, lower, upper, integer
+
+
+def solve_small(model, max_size=SMALL_MODEL_SIZE, fallback=None, max_nodes=MAX_NODES):
+    """
+    Solve a PuLP model in-process if it is small, else with `fallback`
+    (default: CBC with no output). Variable values and model.status are set
+    exactly as model.solve() would set them. Returns 'in-process' or 'cbc'.
+    """
+    variables = model.variables()
+    small = len(variables) * max(1, len(model.constraints)) <= max_size
+    # Free variables would need splitting; leave those models to CBC
+    if small and all(v.lowBound is not None for v in variables):
+        _, c, A_ub, b_ub, A_eq, b_eq, lower, upper, integer = model_arrays(model)
+        try:
+            status, x, _ = branch_and_bound(c, A_ub, b_ub, A_eq, b_eq, lower, upper, integer,
+                                            max_nodes)
+        except NodeLimitReached:
+            pass
+        else:
+            model.status, model.sol_status = {
+                OPTIMAL: (LpStatusOptimal, LpSolutionOptimal),
+                INFEASIBLE: (LpStatusInfeasible, LpSolutionInfeasible),
+                UNBOUNDED: (LpStatusUnbounded, LpSolutionUnbounded)}[status]
+            for j, var in enumerate(variables):
+                var.varValue = None if x is None else float(x[j])
+            return 'in-process'
+    model.solve(fallback or PULP_CBC_CMD(msg=False))
+    return 'cbc'
@@ -0,0 +1,125 @@
+"""
+Sorting engine to use instead of bubble_sort from Task-2.py.
+
+All functions return a new sorted sequence and leave their input alone, and
+all of them are stable: items that compare equal (or have equal keys) keep
+their original order.
+
+- adaptive_sort: any comparable items, with optional key and reverse.
+  Uses Timsort, which keeps bubble_sort's early exit: it finds existing
+  ascending or strictly descending runs in one pass, so sorted or reversed
+  input costs n - 1 comparisons and nearly-sorted input stays close to O(n).
+- radix_sort: LSD radix sort for integers, one byte per pass, skipping
+  the bytes that all values share.
+- sort_array: NumPy arrays, sorted with NumPy's stable sort.
+- sort: chooses among the above.
+"""
+import numpy as np
+
+RADIX_BITS = 8
+RADIX_MIN_SIZE = 2_048  # below this the conversion to NumPy costs more than it saves
+SORTEDNESS_SAMPLE = 64  # adjacent pairs sampled before choosing radix_sort over Timsort
+PRESORTED_FRACTION = 0.1  # at most this share of sampled pairs out of (or in) order
+
+
+def adaptive_sort(items, key=None, reverse=False):
+    """Return a stably sorted list of items."""
+    # Timsort detects the runs itself; a separate sortedness pass in Python
+    # would cost more than it saves
+    return sorted(items, key=key, reverse=reverse)
+
+
+def _radix_argsort(values):
+    """Stable LSD radix argsort of an int64 array, one byte per pass."""
+    # Subtract the minimum (with uint64 wrap-around) so every value is a
+    # non-negative offset and only the bytes that vary need a pass
+    offset = values.astype(np.uint64) - values.min().astype(np.uint64)
+    span = int(offset.max())
+    order = np.arange(len(values))
+    shift = 0
+    while span >> shift:
+        digit = ((offset[order] >> np.uint64(shift)) & np.uint64(0xFF)).astype(np.uint8)
+        # A stable sort on 8-bit keys is a counting pass (NumPy uses radix sort here)
+        order = order[np.argsort(digit, kind='stable')]
+        shift += RADIX_BITS
+    return order
+
+
+def radix_sort(ints, reverse=False):
+    """
+    Sort integers with an LSD radix sort. Accepts a list or an integer NumPy
+    array and returns the same kind. Values must fit in 64 bits.
+    """
+    as_list = not isinstance(ints, np.ndarray)
+    if not len(ints):
+        return [] if as_list else ints.copy()
+    values = np.asarray(ints)
+    if values.dtype == object or not np.issubdtype(values.dtype, np.integer):
+        raise TypeError("radix_sort() requires integers that fit in 64 bits")
+    if values.dtype == np.uint64 and values.max() > np.iinfo(np.int64).max:
+        raise TypeError("radix_sort() requires integers that fit in 64 bits")
+    values64 = values.astype(np.int64)
+    if reverse:
+        # Sort the reversed input and reverse the order back: descending, and
+        # equal values keep their original order
+        order = len(values) - 1 - _radix_argsort(values64[::-1])[::-1]
+    else:
+        order = _radix_argsort(values64)
+    result = values[order]
+    return result.tolist() if as_list else result
+
+
+def sort_array(array, reverse=False):
+    """Return a stably sorted copy of a 1-D NumPy array."""
+    if reverse:
+        # Reversing before and after a stable ascending sort keeps equal items in order
+        return np.sort(array[::-1], kind='stable')[::-1].copy()
+    return np.sort(array, kind='stable')
+
+
+def _looks_presorted(items):
+    """
+    Check SORTEDNESS_SAMPLE evenly spaced adjacent pairs. Random data has
+    about half of them out of order; sorted, reversed or nearly-sorted data
+    has almost none or almost all, and is left to Timsort's run detection.
+    """
+    step = max(1, (len(items) - 1) // SORTEDNESS_SAMPLE)
+    positions = range(0, len(items) - 1, step)
+    try:
+        descents = sum(items[i] > items[i + 1] for i in positions)
+    except TypeError:
+        return True  # incomparable items; adaptive_sort raises the usual error
+    return not PRESORTED_FRACTION < descents / len(positions) < 1 - PRESORTED_FRACTION
+
+
+def sort(items, key=None, reverse=False):
+    """
+    Return a stably sorted copy of items using the fastest suitable path:
+    NumPy arrays without a key use sort_array; large lists of 64-bit ints
+    without a key use radix_sort unless a sample shows they are already
+    (nearly) sorted or reversed; everything else uses adaptive_sort.
+    """
+    if isinstance(items, np.ndarray) and items.ndim == 1 and key is None:
+        return sort_array(items, reverse)
+    if not isinstance(items, list):
+        items = list(items)
+    # The sample is O(1); the type check (at C speed) only runs for unsorted data
+    if (key is None and len(items) >= RADIX_MIN_SIZE and not _looks_presorted(items)
+            and set(map(type, items)) == {int}):
+        try:
+            values = np.fromiter(items, dtype=np.int64, count=len(items))
+        except OverflowError:
+            pass  # some value needs more than 64 bits
+        else:
+            return radix_sort(values, reverse).tolist()
+    return adaptive_sort(items, key, reverse)
+
+
+# Main program
+if __name__ == "__main__":
+    try:
+        user_input = input("Enter numbers separated by spaces: ")
+        numbers = list(map(int, user_input.strip().split()))
+        print("Sorted list:", sort(numbers))
+    except ValueError:
+        print("Please enter valid integers separated by spaces.")
@@ -31,17 +31,28 @@ def validate_inputs(inputs: Inputs) -> bool:
     
     return True
 
+# Energy charge slabs as (upper limit in kWh, rate in ₹/unit)
+DOMESTIC_SLABS = [
+    (50, 1.95),
+    (100, 3.10),
+    (200, 4.80),
+    (300, 7.70),
+    (400, 9.00),
+    (800, 9.50),
+    (float('inf'), 10.00)
+]
+
+COMMERCIAL_SLABS = [
+    (50, 7.00),
+    (100, 8.50),
+    (300, 9.90),
+    (500, 10.40),
+    (float('inf'), 11.00)
+]
+
 def energy_charges_domestic(units: float) -> float:
     """Calculate energy charges for domestic consumers."""
-    slabs = [
-        (50, 1.95),
-        (100, 3.10),
-        (200, 4.80),
-        (300, 7.70),
-        (400, 9.00),
-        (800, 9.50),
-        (float('inf'), 10.00)
-    ]
+    slabs = DOMESTIC_SLABS
     
     total_charge = 0
     remaining_units = units
@@ -59,13 +70,7 @@ def energy_charges_domestic(units: float) -> float:
 
 def energy_charges_commercial(units: float) -> float:
     """Calculate energy charges for commercial consumers."""
-    slabs = [
-        (50, 7.00),
-        (100, 8.50),
-        (300, 9.90),
-        (500, 10.40),
-        (float('inf'), 11.00)
-    ]
+    slabs = COMMERCIAL_SLABS
     
     total_charge = 0
     remaining_units = units
@@ -0,0 +1,222 @@
+"""
+Benchmark harness for the TGNPDCL billing engine.
+
+Generates synthetic consumer populations and times three billing paths:
+
+    scalar    compute_bill from Task-1.py, one consumer at a time
+    batch     compute_bills over chunks of consumers in one process
+    parallel  compute_bills over chunks spread across a process pool
+
+Only the billing calls are timed, so rows/sec compares across paths; for
+the parallel path that is the busiest worker's billing time, and the
+wall-clock time including pool startup and data generation is reported
+as wall_seconds.
+
+Every (path, size) case runs in a fresh process, so its peak RSS is its own.
+Results are written as JSON so runs can be compared between releases.
+
+Usage:
+    python bench_billing.py --sizes 1e3 1e4 1e5 1e6 1e7 1e8 -o bench.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Tuple
+
+import numpy as np
+
+from batch_billing import calc, compute_bills
+
+PATHS = ('scalar', 'batch', 'parallel')
+
+
+def synthetic_population(n: int, seed: int) -> Dict[str, np.ndarray]:
+    """
+    Generate n consumers with a realistic mix: 85% domestic, monthly units
+    drawn from log-normal distributions (median ~150 kWh domestic, ~450 kWh
+    commercial), loads and phases that follow the customer type, and a
+    free-200 eligible share of domestic consumers.
+    """
+    rng = np.random.default_rng(seed)
+    domestic = rng.random(n) < 0.85
+    units = np.where(domestic, rng.lognormal(np.log(150), 0.6, n),
+                     rng.lognormal(np.log(450), 0.8, n)).round()
+    prev = rng.integers(0, 100_000, n).astype(float)
+    load = np.where(domestic, rng.choice([0.5, 1.0, 2.0, 3.0, 5.0], n, p=[.1, .35, .3, .15, .1]),
+                    rng.choice([2.0, 5.0, 10.0, 20.0], n, p=[.3, .4, .2, .1]))
+    three = rng.random(n) < np.where(domestic, 0.1, 0.5)
+    return {
+        'prev_reading': prev,
+        'curr_reading': prev + units,
+        'customer_type': np.where(domestic, 'domestic', 'commercial'),
+        'load_kw': load,
+        'phase_type': np.where(three, 'three', 'single'),
+        'eligible_free_200': domestic & (rng.random(n) < 0.4),
+        'fsa_rate': rng.choice([0.0, 0.3], n),
+    }
+
+
+def _chunks(n: int, chunk_size: int):
+    for k, start in enumerate(range(0, n, chunk_size)):
+        yield k, min(chunk_size, n - start)
+
+
+def _bill_chunk(seed: int, k: int, size: int) -> float:
+    """Generate and bill one chunk; return the seconds spent billing."""
+    population = synthetic_population(size, seed * 1_000_003 + k)
+    start = time.perf_counter()
+    compute_bills(**population)
+    return time.perf_counter() - start
+
+
+def run_scalar(n: int, seed: int, chunk_size: int) -> float:
+    elapsed = 0.0
+    for k, size in _chunks(n, chunk_size):
+        population = synthetic_population(size, seed * 1_000_003 + k)
+        columns = [population[name].tolist() for name in population]
+        inputs = [calc.Inputs(*row) for row in zip(*columns)]
+        start = time.perf_counter()
+        for consumer in inputs:
+            calc.compute_bill(consumer)
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def run_batch(n: int, seed: int, chunk_size: int) -> float:
+    return sum(_bill_chunk(seed, k, size) for k, size in _chunks(n, chunk_size))
+
+
+def _bill_chunk_in_worker(seed: int, k: int, size: int) -> Tuple[int, float]:
+    return os.getpid(), _bill_chunk(seed, k, size)
+
+
+def run_parallel(n: int, seed: int, chunk_size: int, workers: int) -> Tuple[float, float]:
+    """
+    Return (billing seconds, wall-clock seconds). Billing seconds are the
+    busiest worker's total compute_bills time, comparable with the other
+    paths; wall clock also covers pool startup and data generation.
+    """
+    start = time.perf_counter()
+    busy: Dict[int, float] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_bill_chunk_in_worker, seed, k, size)
+                   for k, size in _chunks(n, chunk_size)]
+        for future in futures:
+            pid, seconds = future.result()
+            busy[pid] = busy.get(pid, 0.0) + seconds
+    return max(busy.values(), default=0.0), time.perf_counter() - start
+
+
+def traced_allocations(n: int, seed: int) -> Dict[str, int]:
+    """Trace allocations while batch-billing one population of n consumers."""
+    population = synthetic_population(n, seed)
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    bills = compute_bills(**population)
+    blocks_after = sys.getallocatedblocks()
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del bills
+    return {
+        'traced_peak_bytes': peak,
+        'live_allocations': sum(stat.count for stat in snapshot.statistics('filename')),
+        'net_allocated_blocks': blocks_after - blocks_before,
+    }
+
+
+def run_case(path: str, n: int, seed: int, chunk_size: int, workers: int) -> dict:
+    """Run one benchmark case; meant to be called in a fresh process."""
+    if path == 'scalar':
+        seconds = run_scalar(n, seed, chunk_size)
+    elif path == 'batch':
+        seconds = run_batch(n, seed, chunk_size)
+    else:
+        seconds, wall_seconds = run_parallel(n, seed, chunk_size, workers)
+    result = {
+        'path': path,
+        'consumers': n,
+        'seconds': round(seconds, 6),
+        'rows_per_sec': round(n / seconds, 1) if seconds else None,
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        // (1024 if sys.platform == 'darwin' else 1),
+    }
+    if path == 'parallel':
+        result['workers'] = workers
+        result['wall_seconds'] = round(wall_seconds, 6)
+        result['peak_worker_rss_kb'] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss \
+            // (1024 if sys.platform == 'darwin' else 1)
+    if path == 'batch':
+        result.update(traced_allocations(min(n, chunk_size), seed))
+    return result
+
+
+def run_isolated(path: str, n: int, seed: int, chunk_size: int, workers: int) -> dict:
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(run_case, path, n, seed, chunk_size, workers).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TGNPDCL billing benchmark")
+    parser.add_argument("--sizes", type=float, nargs='+',
+                        default=[1e3, 1e4, 1e5, 1e6, 1e7, 1e8],
+                        help="population sizes (default: 1e3 through 1e8)")
+    parser.add_argument("--paths", nargs='+', choices=PATHS, default=list(PATHS))
+    parser.add_argument("--scalar-max", type=float, default=1e6,
+                        help="skip the scalar path above this size (default: 1e6)")
+    parser.add_argument("--chunk-size", type=int, default=1_000_000,
+                        help="consumers generated and billed at a time (default: 1000000)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processes for the parallel path (default: all cores)")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("-o", "--output", help="JSON results file (default: stdout)")
+    args = parser.parse_args()
+
+    results = []
+    for n in (int(size) for size in args.sizes):
+        for path in args.paths:
+            if path == 'scalar' and n > args.scalar_max:
+                results.append({'path': path, 'consumers': n, 'skipped': 'above --scalar-max'})
+                continue
+            result = run_isolated(path, n, args.seed, args.chunk_size, args.workers)
+            results.append(result)
+            # rows_per_sec is None (null in the JSON) when the run took no measurable time
+            rate = result['rows_per_sec']
+            rate = f"{rate:>14,.0f}" if rate is not None else f"{'n/a':>14}"
+            print(f"{path:<9}{n:>12,} consumers  {result['seconds']:>10.3f}s  "
+                  f"{rate} rows/sec  "
+                  f"{result['peak_rss_kb'] / 1024:>8.1f} MiB"
+                  + (f"  ({result['wall_seconds']:.3f}s wall clock)" if 'wall_seconds' in result
+                     else ""), file=sys.stderr)
+
+    report = {
+        'benchmark': 'tgnpdcl-billing',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': args.seed,
+        'chunk_size': args.chunk_size,
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Streaming bill run for the TGNPDCL calculator.
+
+Reads a meter-reading file (CSV, or Parquet when pyarrow is installed) in
+fixed-size chunks, validates each row with the `validate_inputs` rules, bills
+the valid rows with `compute_bills` and writes a bills file plus a rejects
+file. Only one chunk is held in memory at a time.
+
+Expected input columns:
+    consumer_id (optional), prev_reading, curr_reading, customer_type,
+    load_kw, phase_type, eligible_free_200 (Y/N), fsa_rate (optional)
+
+Usage:
+    python bill_run.py readings.csv -o bills.csv -r rejects.csv
+"""
+import argparse
+import csv
+import sys
+import time
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from batch_billing import BILL_FIELDS, compute_bills, validate_batch
+from tariff import Tariff, TariffError
+
+INPUT_FIELDS = ('consumer_id', 'prev_reading', 'curr_reading', 'customer_type',
+                'load_kw', 'phase_type', 'eligible_free_200', 'fsa_rate')
+OUTPUT_FIELDS = INPUT_FIELDS + BILL_FIELDS
+REJECT_FIELDS = INPUT_FIELDS + ('reason',)
+
+
+@dataclass
+class RunStats:
+    """Throughput counters for a bill run."""
+    rows_read: int = 0
+    rows_billed: int = 0
+    rows_rejected: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows_read / self.elapsed if self.elapsed else 0.0
+
+    def add(self, other: "RunStats"):
+        self.rows_read += other.rows_read
+        self.rows_billed += other.rows_billed
+        self.rows_rejected += other.rows_rejected
+
+    def summary(self) -> str:
+        return (f"{self.rows_read} rows read, {self.rows_billed} billed, "
+                f"{self.rows_rejected} rejected in {self.elapsed:.2f}s "
+                f"({self.rows_per_sec:,.0f} rows/sec)")
+
+
+def is_parquet(path) -> bool:
+    return Path(path).suffix.lower() in ('.parquet', '.pq')
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        print("Error: Parquet files need pyarrow. Install it with 'pip install pyarrow'.")
+        sys.exit(1)
+    return sys.modules['pyarrow'], sys.modules['pyarrow.parquet']
+
+
+def read_chunks(path, chunk_size: int) -> Iterator[List[Dict]]:
+    """Yield the rows of a CSV or Parquet file as lists of at most chunk_size dicts."""
+    if is_parquet(path):
+        _, pq = _require_pyarrow()
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pylist()
+        return
+    with open(path, newline='') as file:
+        yield from read_csv_chunks(file, chunk_size)
+
+
+def read_csv_chunks(file, chunk_size: int, fieldnames=None) -> Iterator[List[Dict]]:
+    """Yield rows from an open CSV file in chunks of at most chunk_size dicts."""
+    reader = csv.DictReader(file, fieldnames=fieldnames)
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_flag(value) -> bool:
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    return str(value).strip().upper() in ('Y', 'YES', 'TRUE', '1')
+
+
+def parse_row(row: Dict) -> Tuple:
+    """Parse one raw row the same way get_user_inputs parses typed input."""
+    fsa = row.get('fsa_rate')
+    return (
+        float(row['prev_reading']),
+        float(row['curr_reading']),
+        str(row['customer_type']).strip().lower(),
+        float(row['load_kw']),
+        str(row['phase_type']).strip().lower(),
+        _parse_flag(row.get('eligible_free_200', 'N')),
+        float(fsa) if fsa not in (None, '') and str(fsa).strip() else 0.0,
+    )
+
+
+def bill_chunk(rows: List[Dict], tariff=None) -> Tuple[List[Dict], List[Dict]]:
+    """Validate and bill one chunk of raw rows. Returns (bills, rejects)."""
+    parsed, kept, positions, rejects = [], [], [], []
+    for pos, row in enumerate(rows):
+        try:
+            parsed.append(parse_row(row))
+            kept.append(row)
+            positions.append(pos)
+        except (KeyError, TypeError, ValueError):
+            rejects.append((pos, dict(row, reason="Invalid input! Numeric values required.")))
+    if not parsed:
+        return [], [row for _, row in rejects]
+
+    prev, curr, cust, load, phase, eligible, fsa = (np.array(column) for column in zip(*parsed))
+    reasons = validate_batch(prev, curr, cust, load, phase)
+    valid = reasons == ''
+    for k in np.flatnonzero(~valid):
+        rejects.append((positions[k], dict(kept[k], reason=reasons[k])))
+    # Keep rejects in input order
+    rejects = [row for _, row in sorted(rejects, key=lambda r: r[0])]
+
+    bills = []
+    idx = np.flatnonzero(valid)
+    if len(idx):
+        bill = compute_bills(prev[idx], curr[idx], cust[idx], load[idx],
+                             phase[idx], eligible[idx], fsa[idx], tariff)
+        columns = [bill[name].tolist() for name in BILL_FIELDS]
+        for j, k in enumerate(idx):
+            out = dict(kept[k])
+            out.update(zip(BILL_FIELDS, (column[j] for column in columns)))
+            bills.append(out)
+    return bills, rejects
+
+
+class RowWriter:
+    """Write dict rows to a CSV or Parquet file with a fixed set of columns."""
+
+    def __init__(self, path, fieldnames):
+        self.path = path
+        self.fieldnames = list(fieldnames)
+        self._parquet = is_parquet(path)
+        if self._parquet:
+            pa, self._pq = _require_pyarrow()
+            self._pa = pa
+            self._schema = pa.schema([(name, pa.float64() if name in BILL_FIELDS else pa.string())
+                                      for name in self.fieldnames])
+            self._writer = self._pq.ParquetWriter(path, self._schema)
+        else:
+            self._file = open(path, 'w', newline='')
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames,
+                                          extrasaction='ignore')
+            self._writer.writeheader()
+
+    def write_rows(self, rows: List[Dict]):
+        if not rows:
+            return
+        if not self._parquet:
+            self._writer.writerows(rows)
+            return
+        columns = {}
+        for name in self.fieldnames:
+            values = [row.get(name) for row in rows]
+            if name not in BILL_FIELDS:
+                values = [None if v is None else str(v) for v in values]
+            columns[name] = values
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+
+    def close(self):
+        if self._parquet:
+            self._writer.close()
+        else:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def add_type_totals(bills: List[Dict], totals: Dict[str, Dict[str, float]]):
+    """Accumulate consumer count, units and amount billed per customer type."""
+    for bill in bills:
+        cust = str(bill['customer_type']).strip().lower()
+        entry = totals.setdefault(cust, {'consumers': 0, 'units': 0.0, 'amount': 0.0})
+        entry['consumers'] += 1
+        entry['units'] += bill['units']
+        entry['amount'] += bill['total']
+
+
+def bill_chunks(chunks, bills_out: RowWriter, rejects_out: RowWriter,
+                progress_every: int = 10, label: str = "", totals=None,
+                tariff=None) -> RunStats:
+    """
+    Bill an iterable of row chunks into the given writers.
+    If a totals dict is given, per-customer-type totals are accumulated into it.
+    """
+    stats = RunStats()
+    start = time.perf_counter()
+    for n, chunk in enumerate(chunks, start=1):
+        bills, rejects = bill_chunk(chunk, tariff)
+        if totals is not None:
+            add_type_totals(bills, totals)
+        bills_out.write_rows(bills)
+        rejects_out.write_rows(rejects)
+        stats.rows_read += len(chunk)
+        stats.rows_billed += len(bills)
+        stats.rows_rejected += len(rejects)
+        stats.elapsed = time.perf_counter() - start
+        if progress_every and n % progress_every == 0:
+            print(f"{label}{stats.summary()}", file=sys.stderr)
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def run_bill(input_path, output_path, rejects_path, chunk_size: int = 100_000,
+             progress_every: int = 10, tariff=None) -> RunStats:
+    """Bill a whole reading file into output_path and rejects_path."""
+    with RowWriter(output_path, OUTPUT_FIELDS) as bills_out, \
+            RowWriter(rejects_path, REJECT_FIELDS) as rejects_out:
+        return bill_chunks(read_chunks(input_path, chunk_size), bills_out, rejects_out,
+                           progress_every, tariff=tariff)
+
+
+def load_tariff(path):
+    """Load a tariff file for a run, exiting with a message if it is malformed."""
+    try:
+        return Tariff.from_file(path)
+    except (OSError, TariffError) as e:
+        print(f"Error: Cannot load tariff: {e}")
+        sys.exit(1)
+
+
+def default_paths(input_path) -> Tuple[Path, Path]:
+    path = Path(input_path)
+    suffix = '.parquet' if is_parquet(path) else '.csv'
+    return (path.with_name(f"{path.stem}_bills{suffix}"),
+            path.with_name(f"{path.stem}_rejects{suffix}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TGNPDCL streaming bill run")
+    parser.add_argument("input", help="meter-reading file (.csv or .parquet)")
+    parser.add_argument("-o", "--output", help="bills file (default: <input>_bills)")
+    parser.add_argument("-r", "--rejects", help="rejects file (default: <input>_rejects)")
+    parser.add_argument("--chunk-size", type=int, default=100_000,
+                        help="rows held in memory at a time (default: 100000)")
+    parser.add_argument("--progress-every", type=int, default=10,
+                        help="print throughput every N chunks, 0 to disable")
+    parser.add_argument("--tariff", help="tariff file (default: rates in Task-1.py)")
+    args = parser.parse_args()
+
+    tariff = load_tariff(args.tariff) if args.tariff else None
+    output, rejects = default_paths(args.input)
+    stats = run_bill(args.input, args.output or output, args.rejects or rejects,
+                     args.chunk_size, args.progress_every, tariff)
+    print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
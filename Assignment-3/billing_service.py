@@ -0,0 +1,223 @@
+"""
+Local HTTP/JSON billing service for the TGNPDCL calculator.
+
+Concurrent requests are collected by a micro-batcher and billed together
+with `compute_bills`, then each request gets its own result back.
+
+Endpoints:
+    POST /bill   one consumer object, or a list of them, with the `Inputs`
+                 fields (prev_reading, curr_reading, customer_type, load_kw,
+                 phase_type, eligible_free_200, fsa_rate)
+    GET  /stats  request and batch counters with p50/p99 latency
+    GET  /health liveness check
+
+Usage:
+    python billing_service.py --port 8080 --max-batch 1024 --max-wait-ms 2
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+import numpy as np
+
+from batch_billing import BILL_FIELDS, compute_bills, validate_batch
+from bill_run import parse_row
+from tariff import DEFAULT_TARIFF_PATH, TariffStore
+
+
+class MicroBatcher:
+    """
+    Collect submitted consumers into batches and bill each batch at once.
+
+    A batch is closed when it reaches `max_batch` consumers or `max_wait`
+    seconds after its first consumer arrived, whichever comes first.
+    """
+
+    def __init__(self, tariffs: TariffStore, max_batch: int = 1024, max_wait: float = 0.002):
+        self.tariffs = tariffs
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.consumers = 0
+        self._pending = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, fields: tuple) -> Future:
+        """Queue one parsed consumer; the future resolves to its bill dict."""
+        future = Future()
+        self._pending.put((fields, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._bill(batch)
+
+    def _bill(self, batch):
+        try:
+            columns = [np.array(column) for column in zip(*(fields for fields, _ in batch))]
+            bill = compute_bills(*columns, tariff=self.tariffs.current())
+            values = {name: bill[name].tolist() for name in BILL_FIELDS}
+            for k, (_, future) in enumerate(batch):
+                future.set_result({name: values[name][k] for name in BILL_FIELDS})
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        self.batches += 1
+        self.consumers += len(batch)
+
+
+class LatencyStats:
+    """Rolling window of request latencies."""
+
+    def __init__(self, window: int = 10_000):
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def record(self, seconds: float, ok: bool = True):
+        with self._lock:
+            self._latencies.append(seconds)
+            self.requests += 1
+            if not ok:
+                self.errors += 1
+
+    def percentiles(self) -> Dict[str, float]:
+        with self._lock:
+            latencies = np.array(self._latencies)
+        if not len(latencies):
+            return {'p50_ms': 0.0, 'p99_ms': 0.0}
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        return {'p50_ms': round(float(p50), 3), 'p99_ms': round(float(p99), 3)}
+
+
+def parse_consumers(payload) -> List[tuple]:
+    """Parse and validate a JSON payload. Raises ValueError with a message on bad input."""
+    items = payload if isinstance(payload, list) else [payload]
+    if not items or not all(isinstance(item, dict) for item in items):
+        raise ValueError("Expected a consumer object or a list of them")
+    try:
+        parsed = [parse_row(item) for item in items]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid input! Numeric values required. ({e})")
+    prev, curr, cust, load, phase, _, _ = zip(*parsed)
+    reasons = validate_batch(prev, curr, cust, load, phase)
+    for k, reason in enumerate(reasons):
+        if reason:
+            raise ValueError(f"Consumer {k}: {reason}")
+    return parsed
+
+
+class BillingHandler(BaseHTTPRequestHandler):
+    batcher: MicroBatcher = None
+    latency: LatencyStats = None
+    timeout_s: float = 5.0
+
+    def _send_json(self, status: int, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == "/stats":
+            batcher = self.batcher
+            self._send_json(200, {
+                'requests': self.latency.requests,
+                'errors': self.latency.errors,
+                'batches': batcher.batches,
+                'mean_batch_size': round(batcher.consumers / batcher.batches, 2)
+                if batcher.batches else 0.0,
+                'tariff_version': batcher.tariffs.current().version,
+                'latency': self.latency.percentiles(),
+            })
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        start = time.perf_counter()
+        if self.path != "/bill":
+            self._send_json(404, {'error': 'Not found'})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"null")
+            consumers = parse_consumers(payload)
+        except ValueError as e:
+            self.latency.record(time.perf_counter() - start, ok=False)
+            self._send_json(400, {'error': str(e)})
+            return
+        try:
+            futures = [self.batcher.submit(fields) for fields in consumers]
+            bills = [future.result(timeout=self.timeout_s) for future in futures]
+        except Exception as e:
+            self.latency.record(time.perf_counter() - start, ok=False)
+            self._send_json(500, {'error': str(e)})
+            return
+        self._send_json(200, bills if isinstance(payload, list) else bills[0])
+        self.latency.record(time.perf_counter() - start)
+
+    def log_message(self, format, *args):
+        pass  # per-request logging would dominate latency under load
+
+
+class BillingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # the default backlog of 5 resets connections under load
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8080, tariff_path=DEFAULT_TARIFF_PATH,
+                max_batch: int = 1024, max_wait: float = 0.002) -> ThreadingHTTPServer:
+    handler = type("Handler", (BillingHandler,), {
+        'batcher': MicroBatcher(TariffStore(tariff_path), max_batch, max_wait),
+        'latency': LatencyStats(),
+    })
+    return BillingServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TGNPDCL billing HTTP service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--tariff", default=str(DEFAULT_TARIFF_PATH),
+                        help="tariff file, reloaded when it changes")
+    parser.add_argument("--max-batch", type=int, default=1024,
+                        help="most consumers billed in one batch (default: 1024)")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0,
+                        help="longest a request waits for its batch to fill (default: 2)")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.tariff, args.max_batch,
+                         args.max_wait_ms / 1000)
+    print(f"Billing service listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Shutting down.")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Multi-process sharded bill run for the TGNPDCL calculator.
+
+Splits a CSV meter-reading file into byte ranges aligned to line starts,
+bills each shard in a worker process with the same chunked pipeline as
+bill_run.py and concatenates the shard outputs in shard order, so the
+result is identical to a single-process run. Rows must not contain
+embedded newlines.
+
+Usage:
+    python parallel_bill_run.py readings.csv -o bills.csv -r rejects.csv --workers 32
+"""
+import argparse
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from bill_run import (OUTPUT_FIELDS, REJECT_FIELDS, RowWriter, RunStats, bill_chunks,
+                      default_paths, is_parquet, load_tariff)
+from tariff import Tariff
+
+
+def shard_ranges(path, shards: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Return the CSV header and `shards` byte ranges covering the data rows.
+    A row belongs to the range that contains its first byte.
+    """
+    with open(path, 'rb') as file:
+        header = next(csv.reader([file.readline().decode()]))
+        data_start = file.tell()
+    size = os.path.getsize(path)
+    step = max(1, (size - data_start) // shards)
+    bounds = [min(size, data_start + k * step) for k in range(shards)] + [size]
+    return header, [(bounds[k], bounds[k + 1]) for k in range(shards)
+                    if bounds[k] < bounds[k + 1]]
+
+
+def read_range_lines(path, start: int, end: int) -> Iterator[str]:
+    """Yield the decoded lines whose first byte lies in [start, end)."""
+    with open(path, 'rb') as file:
+        if start > 0:
+            # Skip the tail of a line that began in the previous shard
+            file.seek(start - 1)
+            file.readline()
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                return
+            yield line.decode()
+
+
+def read_range_chunks(path, start: int, end: int, header: List[str],
+                      chunk_size: int) -> Iterator[List[Dict]]:
+    reader = csv.DictReader(read_range_lines(path, start, end), fieldnames=header)
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bill_shard(shard: int, path, start: int, end: int, header: List[str], out_dir,
+               chunk_size: int, progress_every: int,
+               tariff: Tariff = None) -> Tuple[int, RunStats, Dict]:
+    """Worker: bill one byte range into shard files in out_dir."""
+    totals: Dict[str, Dict[str, float]] = {}
+    bills_path = Path(out_dir) / f"bills_{shard:05d}.csv"
+    rejects_path = Path(out_dir) / f"rejects_{shard:05d}.csv"
+    with RowWriter(bills_path, OUTPUT_FIELDS) as bills_out, \
+            RowWriter(rejects_path, REJECT_FIELDS) as rejects_out:
+        stats = bill_chunks(read_range_chunks(path, start, end, header, chunk_size),
+                            bills_out, rejects_out, progress_every,
+                            label=f"[shard {shard} pid {os.getpid()}] ", totals=totals,
+                            tariff=tariff)
+    print(f"[shard {shard}] done: {stats.summary()}", file=sys.stderr)
+    return shard, stats, totals
+
+
+def merge_shards(pattern: str, out_dir, shards: int, output_path, fieldnames):
+    """
+    Concatenate shard files in shard order under one header row, written
+    even when there are no shards, as bill_run.py writes it for empty input.
+    """
+    with open(output_path, 'w', newline='') as out:
+        csv.writer(out).writerow(fieldnames)
+    with open(output_path, 'ab') as out:
+        for shard in range(shards):
+            with open(Path(out_dir) / pattern.format(shard), 'rb') as part:
+                part.readline()  # the shard's own header
+                shutil.copyfileobj(part, out, 1 << 20)
+
+
+def merge_totals(parts: List[Dict]) -> Dict[str, Dict[str, float]]:
+    totals: Dict[str, Dict[str, float]] = {}
+    for part in parts:
+        for cust, entry in part.items():
+            merged = totals.setdefault(cust, {'consumers': 0, 'units': 0.0, 'amount': 0.0})
+            for key, val in entry.items():
+                merged[key] += val
+    return totals
+
+
+def parallel_bill_run(input_path, output_path, rejects_path, workers: int = None,
+                      shards: int = None, chunk_size: int = 100_000,
+                      progress_every: int = 10, tariff_path=None) -> Tuple[RunStats, Dict]:
+    """Bill a CSV file across a process pool. Returns (stats, per-type totals)."""
+    if is_parquet(input_path):
+        print("Error: Sharded runs need a CSV input; use bill_run.py for Parquet.")
+        sys.exit(1)
+    # Parse the tariff once and send the same version to every shard, so a
+    # tariff file revised mid-run cannot split the run across versions
+    tariff = load_tariff(tariff_path) if tariff_path else None
+    workers = workers or os.cpu_count() or 1
+    header, ranges = shard_ranges(input_path, shards or workers)
+    out_dir = tempfile.mkdtemp(prefix="bill_shards_", dir=Path(output_path).resolve().parent)
+
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(bill_shard, k, input_path, lo, hi, header, out_dir,
+                                   chunk_size, progress_every, tariff)
+                       for k, (lo, hi) in enumerate(ranges)]
+            results = sorted((f.result() for f in futures), key=lambda r: r[0])
+        merge_shards("bills_{:05d}.csv", out_dir, len(ranges), output_path, OUTPUT_FIELDS)
+        merge_shards("rejects_{:05d}.csv", out_dir, len(ranges), rejects_path, REJECT_FIELDS)
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    stats = RunStats()
+    for _, shard_stats, _ in results:
+        stats.add(shard_stats)
+    stats.elapsed = time.perf_counter() - start
+    return stats, merge_totals([totals for _, _, totals in results])
+
+
+def print_summary(stats: RunStats, totals: Dict[str, Dict[str, float]]):
+    print(stats.summary())
+    print(f"{'Customer type':<15}{'Consumers':>12}{'Units (kWh)':>18}{'Amount (₹)':>18}")
+    for cust in sorted(totals):
+        entry = totals[cust]
+        print(f"{cust:<15}{entry['consumers']:>12}{entry['units']:>18.2f}{entry['amount']:>18.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TGNPDCL sharded multi-process bill run")
+    parser.add_argument("input", help="meter-reading CSV file")
+    parser.add_argument("-o", "--output", help="bills file (default: <input>_bills.csv)")
+    parser.add_argument("-r", "--rejects", help="rejects file (default: <input>_rejects.csv)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--shards", type=int, default=None,
+                        help="byte-range shards (default: one per worker)")
+    parser.add_argument("--chunk-size", type=int, default=100_000,
+                        help="rows held in memory per worker (default: 100000)")
+    parser.add_argument("--progress-every", type=int, default=10,
+                        help="print worker throughput every N chunks, 0 to disable")
+    parser.add_argument("--tariff", help="tariff file (default: rates in Task-1.py)")
+    args = parser.parse_args()
+
+    output, rejects = default_paths(args.input)
+    stats, totals = parallel_bill_run(args.input, args.output or output,
+                                      args.rejects or rejects, args.workers, args.shards,
+                                      args.chunk_size, args.progress_every, args.tariff)
+    print_summary(stats, totals)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Incremental re-billing for the TGNPDCL calculator.
+
+Takes the bills file of an earlier run (bill_run.py output, which keeps
+every consumer's inputs and bill components) and re-bills it for a revised
+FSA rate and/or tariff. Only the components whose inputs changed are
+recomputed:
+
+- a new FSA rate recomputes `fsa` for every billed consumer;
+- a new tariff recomputes `ec` only for the customer types whose slabs
+  changed, and only for consumers whose units reach the first changed slab.
+
+The other components are carried over and the total is re-added in the
+same order as `compute_bill`, so the result matches a full re-bill. Only
+consumers whose total changed are written to the delta file. An updated
+bills file can be written too, to feed the next revision.
+
+Usage:
+    python rebill.py bills.csv --fsa-rate 0.35 -d delta.csv
+    python rebill.py bills.csv --tariff tariff_v2.json --old-tariff tariff.json -d delta.csv -u bills_v2.csv
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from batch_billing import BILL_FIELDS, energy_charges
+from bill_run import OUTPUT_FIELDS, RowWriter, RunStats, load_tariff, parse_row, read_chunks
+from tariff import Tariff
+
+DELTA_FIELDS = ('consumer_id',) + BILL_FIELDS + ('old_total', 'change')
+
+
+def rebill_chunk(rows: List[Dict], old_tariff: Tariff, new_tariff: Tariff,
+                 fsa_rate: Optional[float] = None) -> Tuple[List[Dict], List[Dict]]:
+    """Re-bill one chunk of bill rows. Returns (updated rows, delta rows)."""
+    if not rows:
+        return [], []
+    parsed = [parse_row(row) for row in rows]
+    cust = np.array([p[2] for p in parsed])
+    eligible = np.array([p[5] for p in parsed], dtype=bool)
+    components = {name: np.array([float(row[name]) for row in rows]) for name in BILL_FIELDS}
+    units = components['units']
+    old_total = components['total']
+
+    # Free-200 bills depend only on units and eligibility, so they never change
+    free = eligible & (cust == 'domestic') & (units <= 200)
+
+    if fsa_rate is not None:
+        fsa = units * fsa_rate if fsa_rate else np.zeros_like(units)
+        components['fsa'] = np.where(free, 0.0, fsa)
+
+    for cust_type in ('domestic', 'commercial'):
+        threshold = old_tariff.first_change(new_tariff, cust_type)
+        if threshold is None:
+            continue
+        is_type = (cust == 'domestic') if cust_type == 'domestic' else (cust != 'domestic')
+        affected = np.flatnonzero(is_type & ~free & (units > threshold))
+        if len(affected):
+            components['ec'][affected] = energy_charges(units[affected],
+                                                        new_tariff.tables[cust_type])
+
+    c = components
+    total = c['ec'] + c['fc'] + c['cc'] + c['ed'] + c['fsa']
+    c['total'] = np.where(free, 0.0, total)
+
+    columns = {name: c[name].tolist() for name in BILL_FIELDS}
+    updated, deltas = [], []
+    for k, row in enumerate(rows):
+        out = dict(row)
+        out.update((name, columns[name][k]) for name in BILL_FIELDS)
+        if fsa_rate is not None:
+            out['fsa_rate'] = fsa_rate
+        updated.append(out)
+        if columns['total'][k] != old_total[k]:
+            delta = {name: columns[name][k] for name in BILL_FIELDS}
+            delta.update(consumer_id=row.get('consumer_id'), old_total=old_total[k],
+                         change=columns['total'][k] - old_total[k])
+            deltas.append(delta)
+    return updated, deltas
+
+
+def rebill(bills_path, delta_path, updated_path=None, old_tariff: Tariff = None,
+           new_tariff: Tariff = None, fsa_rate: Optional[float] = None,
+           chunk_size: int = 100_000) -> RunStats:
+    """Stream a bills file through rebill_chunk. `rows_billed` counts changed bills."""
+    old_tariff = old_tariff or Tariff.builtin()
+    new_tariff = new_tariff or old_tariff
+    stats = RunStats()
+    start = time.perf_counter()
+    delta_out = RowWriter(delta_path, DELTA_FIELDS)
+    updated_out = RowWriter(updated_path, OUTPUT_FIELDS) if updated_path else None
+    try:
+        for chunk in read_chunks(bills_path, chunk_size):
+            updated, deltas = rebill_chunk(chunk, old_tariff, new_tariff, fsa_rate)
+            delta_out.write_rows(deltas)
+            if updated_out:
+                updated_out.write_rows(updated)
+            stats.rows_read += len(chunk)
+            stats.rows_billed += len(deltas)
+    finally:
+        delta_out.close()
+        if updated_out:
+            updated_out.close()
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TGNPDCL incremental re-bill")
+    parser.add_argument("bills", help="bills file from an earlier bill run")
+    parser.add_argument("-d", "--delta", help="delta file (default: <bills>_delta)")
+    parser.add_argument("-u", "--updated", help="also write the full updated bills file")
+    parser.add_argument("--fsa-rate", type=float, help="revised FSA rate (₹/unit)")
+    parser.add_argument("--tariff", help="revised tariff file")
+    parser.add_argument("--old-tariff",
+                        help="tariff the bills were computed with (default: rates in Task-1.py)")
+    parser.add_argument("--chunk-size", type=int, default=100_000,
+                        help="rows held in memory at a time (default: 100000)")
+    args = parser.parse_args()
+
+    if args.fsa_rate is None and args.tariff is None:
+        print("Error: Nothing to re-bill; give --fsa-rate and/or --tariff.")
+        sys.exit(1)
+    old_tariff = load_tariff(args.old_tariff) if args.old_tariff else Tariff.builtin()
+    new_tariff = load_tariff(args.tariff) if args.tariff else old_tariff
+    bills = Path(args.bills)
+    delta = args.delta or bills.with_name(f"{bills.stem}_delta{bills.suffix}")
+
+    stats = rebill(bills, delta, args.updated, old_tariff, new_tariff, args.fsa_rate,
+                   args.chunk_size)
+    print(f"{stats.rows_read} bills read, {stats.rows_billed} changed "
+          f"in {stats.elapsed:.2f}s ({stats.rows_per_sec:,.0f} rows/sec)")
+
+
+if __name__ == "__main__":
+    main()
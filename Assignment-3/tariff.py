@@ -0,0 +1,167 @@
+"""
+Versioned tariff tables for the TGNPDCL calculator.
+
+A tariff file (see tariff.json) lists the energy charge slabs per customer
+type as [upper limit, rate] pairs, with null for the open-ended last slab.
+`Tariff` precomputes the charge accumulated at every slab boundary, so an
+energy charge is one bisect plus one multiply. `TariffStore` keeps the
+current tariff for a long-running service and swaps in a new version when
+the file changes, without interrupting bills in flight.
+"""
+import json
+import threading
+import time
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from batch_billing import calc, slab_table
+
+DEFAULT_TARIFF_PATH = Path(__file__).resolve().parent / "tariff.json"
+
+
+class TariffError(ValueError):
+    """Raised when a tariff file is malformed."""
+
+
+def _parse_slabs(cust: str, raw) -> List[Tuple[float, float]]:
+    if not isinstance(raw, list):
+        raise TariffError(f"{cust}: expected a list of [limit, rate] slabs, got {raw!r}")
+    slabs = []
+    prev = 0
+    for k, pair in enumerate(raw):
+        try:
+            limit, rate = pair
+            limit = float('inf') if limit is None else float(limit)
+            rate = float(rate)
+        except (TypeError, ValueError):
+            raise TariffError(f"{cust} slab {k + 1}: expected [limit, rate], got {pair!r}")
+        if limit <= prev:
+            raise TariffError(f"{cust} slab {k + 1}: limits must be increasing")
+        slabs.append((limit, rate))
+        prev = limit
+    if not slabs or slabs[-1][0] != float('inf'):
+        raise TariffError(f"{cust}: last slab must be open-ended (limit null)")
+    return slabs
+
+
+class Tariff:
+    """Precompiled energy charge slabs for one tariff version."""
+
+    def __init__(self, version, energy_slabs: Dict[str, List[Tuple[float, float]]],
+                 description: str = ""):
+        self.version = version
+        self.description = description
+        self.energy_slabs = energy_slabs
+        # Per customer type: (lower bounds, charge up to each lower bound, rates)
+        self.tables = {cust: slab_table(slabs) for cust, slabs in energy_slabs.items()}
+        self._lookup = {cust: tuple(column.tolist() for column in table)
+                        for cust, table in self.tables.items()}
+
+    @classmethod
+    def builtin(cls) -> "Tariff":
+        """The slabs hard-coded in Task-1.py."""
+        return cls("builtin", {'domestic': list(calc.DOMESTIC_SLABS),
+                               'commercial': list(calc.COMMERCIAL_SLABS)})
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Tariff":
+        if not isinstance(data, dict):
+            raise TariffError("a tariff must be a JSON object")
+        try:
+            raw_slabs = data["energy_slabs"]
+            version = data["version"]
+        except KeyError as e:
+            raise TariffError(f"missing tariff field {e}")
+        if not isinstance(raw_slabs, dict):
+            raise TariffError("energy_slabs must map customer types to slab lists")
+        slabs = {cust.lower(): _parse_slabs(cust, raw) for cust, raw in raw_slabs.items()}
+        for cust in ('domestic', 'commercial'):
+            if cust not in slabs:
+                raise TariffError(f"no energy slabs for '{cust}' customers")
+        return cls(version, slabs, data.get("description", ""))
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_TARIFF_PATH) -> "Tariff":
+        with open(path, encoding='utf-8') as file:
+            try:
+                data = json.load(file)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise TariffError(f"{path}: {e}")
+        return cls.from_dict(data)
+
+    def energy_charges(self, cust_type: str, units: float) -> float:
+        """Calculate energy charges with one bisect over the slab boundaries."""
+        lowers, cumulative, rates = self._lookup[
+            'domestic' if cust_type == 'domestic' else 'commercial']
+        k = bisect_right(lowers, units) - 1
+        return cumulative[k] + (units - lowers[k]) * rates[k]
+
+    def first_change(self, other: "Tariff", cust: str):
+        """
+        Return the units above which `other` charges `cust` consumers differently,
+        or None if their energy slabs are identical.
+        """
+        mine = list(zip(self._lookup[cust][0], self._lookup[cust][2]))
+        theirs = list(zip(other._lookup[cust][0], other._lookup[cust][2]))
+        if mine == theirs:
+            return None
+        for (lower, rate), (other_lower, other_rate) in zip(mine, theirs):
+            if lower != other_lower or rate != other_rate:
+                return min(lower, other_lower)
+        return min(mine[-1][0], theirs[-1][0])
+
+    def __repr__(self):
+        return f"Tariff(version={self.version!r})"
+
+
+class TariffStore:
+    """
+    Hold the current tariff and reload it when the tariff file changes.
+
+    `current()` checks the file's modification time at most once every
+    `check_interval` seconds. A new version is fully parsed and precompiled
+    before it replaces the old one, so callers always see a complete tariff.
+    A malformed file is reported and the previous version stays in use.
+    """
+
+    def __init__(self, path=DEFAULT_TARIFF_PATH, check_interval: float = 1.0):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = self.path.stat().st_mtime_ns
+        self._tariff = Tariff.from_file(self.path)
+        self._next_check = time.monotonic() + check_interval
+
+    def current(self) -> Tariff:
+        if time.monotonic() >= self._next_check:
+            self._maybe_reload()
+        return self._tariff
+
+    def reload(self) -> Tariff:
+        """Reload the tariff file now, regardless of its modification time."""
+        with self._lock:
+            self._load()
+        return self._tariff
+
+    def _maybe_reload(self):
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            try:
+                mtime = self.path.stat().st_mtime_ns
+            except OSError as e:
+                print(f"Error: Cannot read tariff file: {e}")
+                return
+            if mtime != self._mtime:
+                self._load()
+
+    def _load(self):
+        try:
+            # Remember the mtime even if parsing fails, so a bad file is reported once
+            self._mtime = self.path.stat().st_mtime_ns
+            tariff = Tariff.from_file(self.path)
+        except (OSError, TariffError) as e:
+            print(f"Error: Keeping tariff version {self._tariff.version}: {e}")
+            return
+        self._tariff = tariff  # single reference swap
+        print(f"Loaded tariff version {tariff.version}")